@@ -8,13 +8,334 @@ Host IP Detection for RemBraille
 Automatically detects the IP address of the host system when running in a VM
 """
 
+import ctypes
+import errno
+import select
 import socket
-import subprocess
-import ipaddress
+import struct
+import sys
 import re
-from typing import List, Optional, Tuple
+import threading
+import time
+from functools import lru_cache, wraps
+from typing import Any, Callable, Dict, Generic, List, Optional, Set, Tuple, TypeVar, Union
 from logHandler import log
 
+_T = TypeVar("_T")
+
+_IS_WINDOWS = sys.platform == "win32"
+
+# Routing/ARP table flags (linux/route.h, linux/if_arp.h)
+_RTF_UP = 0x0001
+_RTF_GATEWAY = 0x0002
+_ARPHRD_ETHER = 0x1
+_ATF_COM = 0x2
+
+# iphlpapi constants (winerror.h, ipmib.h)
+_ERROR_INSUFFICIENT_BUFFER = 122
+_MIB_IPNET_TYPE_DYNAMIC = 3
+_MIB_IPNET_TYPE_STATIC = 4
+_ERROR_BUFFER_OVERFLOW = 111
+_GAA_FLAG_SKIP_ANYCAST = 0x0002
+_GAA_FLAG_SKIP_MULTICAST = 0x0004
+_GAA_FLAG_SKIP_DNS_SERVER = 0x0008
+# Initial GetAdaptersAddresses buffer size recommended by the Windows documentation
+_GAA_INITIAL_BUFFER_SIZE = 15000
+
+# ioctl to read an interface's IPv4 address (linux/sockios.h)
+_SIOCGIFADDR = 0x8915
+
+# Patterns for parsing ipconfig/ip/route/arp output in the command fallbacks
+_RE_GATEWAY_WIN = re.compile(r"Default Gateway.*?:\s*(\d+\.\d+\.\d+\.\d+)", re.IGNORECASE)
+_RE_IP_ROUTE = re.compile(r"default via (\d+\.\d+\.\d+\.\d+)")
+_RE_ROUTE_GET = re.compile(r"gateway: (\d+\.\d+\.\d+\.\d+)")
+_RE_ARP_DOT1 = re.compile(r"\b(\d+\.\d+\.\d+\.1)\b")
+
+_IPV4 = struct.Struct("!L")
+
+# Well-known host IPs per private network, as (network, netmask, host IPs) integer ranges
+_VM_HOST_NETWORKS: List[Tuple[int, int, List[str]]] = [
+	(
+		0xC0A80000,  # 192.168.0.0
+		0xFFFF0000,  # 255.255.0.0
+		[
+			"192.168.1.1",
+			"192.168.0.1",
+			"192.168.56.1",  # VirtualBox host-only
+			"192.168.137.1",  # Hyper-V
+		],
+	),
+]
+
+# Bounds for the RTT-based host probe timeout (seconds); the RTT is only measured to the
+# gateway, so the floor leaves room for candidate hosts further away or slower to answer
+_MIN_PROBE_TIMEOUT = 0.25
+_MAX_PROBE_TIMEOUT = 2.0
+
+# How long detection results stay cached
+_VM_HOST_IP_TTL = 30.0
+_VM_PLATFORM_TTL = 300.0
+_SUGGESTIONS_TTL = 10.0
+
+# Static host IP suggestions
+_LOCALHOST_SUGGESTION = ("127.0.0.1", "Localhost (for debugging/testing)")
+
+_PLATFORM_SUGGESTIONS: Dict[Optional[str], List[Tuple[str, str]]] = {
+	"vmware": [
+		("192.168.142.1", "VMware Workstation host"),
+		("192.168.91.1", "VMware Fusion host"),
+	],
+	"virtualbox": [
+		("192.168.56.1", "VirtualBox host-only"),
+		("10.0.2.2", "VirtualBox NAT gateway"),
+	],
+	"parallels": [
+		("10.211.55.2", "Parallels shared networking"),
+		("192.168.1.1", "Parallels bridged networking"),
+	],
+}
+
+_COMMON_SUGGESTIONS: List[Tuple[str, str]] = [
+	("192.168.1.1", "Common router/host IP"),
+	("192.168.0.1", "Common router/host IP"),
+	("192.168.56.1", "VirtualBox host-only adapter"),
+	("192.168.137.1", "Windows Hyper-V"),
+	("10.0.2.2", "VirtualBox NAT gateway"),
+	("172.16.0.1", "VMware host IP"),
+]
+
+_suggestion_refresh_thread: Optional[threading.Thread] = None
+_suggestion_refresh_lock = threading.Lock()
+
+# Detections running right now, cancelled together by cancel_detection()
+_active_detections: Set["_Detection"] = set()
+_active_detections_lock = threading.Lock()
+
+# IPv4 address held in network byte order in a host-order 32-bit integer (/proc/net, MIB rows);
+# native byte order with a fixed 4-byte size turns it back into the network-order bytes
+_NATIVE_U32 = struct.Struct("=L")
+
+# connect_ex results meaning a non-blocking connect is still in progress
+_CONNECT_IN_PROGRESS = (errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN, getattr(errno, "WSAEWOULDBLOCK", 10035))
+# Connect errors meaning the peer answered with a reset
+_CONNECT_REFUSED = (errno.ECONNREFUSED, getattr(errno, "WSAECONNREFUSED", 10061))
+
+
+class MIB_IPFORWARDROW(ctypes.Structure):
+	"""One row of the Windows IP routing table (ipmib.h)"""
+	_fields_ = [
+		("dwForwardDest", ctypes.c_uint32),
+		("dwForwardMask", ctypes.c_uint32),
+		("dwForwardPolicy", ctypes.c_uint32),
+		("dwForwardNextHop", ctypes.c_uint32),
+		("dwForwardIfIndex", ctypes.c_uint32),
+		("dwForwardType", ctypes.c_uint32),
+		("dwForwardProto", ctypes.c_uint32),
+		("dwForwardAge", ctypes.c_uint32),
+		("dwForwardNextHopAS", ctypes.c_uint32),
+		("dwForwardMetric1", ctypes.c_uint32),
+		("dwForwardMetric2", ctypes.c_uint32),
+		("dwForwardMetric3", ctypes.c_uint32),
+		("dwForwardMetric4", ctypes.c_uint32),
+		("dwForwardMetric5", ctypes.c_uint32),
+	]
+
+
+class MIB_IPNETROW(ctypes.Structure):
+	"""One row of the Windows ARP table (ipmib.h)"""
+	_fields_ = [
+		("dwIndex", ctypes.c_uint32),
+		("dwPhysAddrLen", ctypes.c_uint32),
+		("bPhysAddr", ctypes.c_ubyte * 8),
+		("dwAddr", ctypes.c_uint32),
+		("dwType", ctypes.c_uint32),
+	]
+
+
+class IP_ADAPTER_UNICAST_ADDRESS(ctypes.Structure):
+	"""Leading fields of a Windows unicast address entry (iptypes.h)"""
+
+
+IP_ADAPTER_UNICAST_ADDRESS._fields_ = [
+	("Length", ctypes.c_uint32),
+	("Flags", ctypes.c_uint32),
+	("Next", ctypes.POINTER(IP_ADAPTER_UNICAST_ADDRESS)),
+	("lpSockaddr", ctypes.c_void_p),
+	("iSockaddrLength", ctypes.c_int),
+]
+
+
+class IP_ADAPTER_ADDRESSES(ctypes.Structure):
+	"""Leading fields of a Windows adapter entry (iptypes.h), enough to walk the list"""
+
+
+IP_ADAPTER_ADDRESSES._fields_ = [
+	("Length", ctypes.c_uint32),
+	("IfIndex", ctypes.c_uint32),
+	("Next", ctypes.POINTER(IP_ADAPTER_ADDRESSES)),
+	("AdapterName", ctypes.c_char_p),
+	("FirstUnicastAddress", ctypes.POINTER(IP_ADAPTER_UNICAST_ADDRESS)),
+]
+
+
+# Sentinel returned by _TTLCache.peek() when nothing fresh is cached
+_MISSING = object()
+
+
+class _Uncached(Generic[_T]):
+	"""Producer result that _TTLCache.get() unwraps and returns without caching (e.g. a fallback)"""
+	
+	__slots__ = ("value",)
+	
+	def __init__(self, value: _T):
+		self.value = value
+
+
+class _Flight:
+	"""A value being produced for a _TTLCache key, awaited by concurrent callers"""
+	
+	__slots__ = ("done", "value", "failed")
+	
+	def __init__(self):
+		self.done = threading.Event()
+		self.value: Any = None
+		self.failed = False
+
+
+class _TTLCache:
+	"""
+	Thread-safe cache of values that expire after a time-to-live (monotonic clock)
+	
+	Single-flight: callers missing the same key while its value is being produced
+	wait for that producer instead of running their own.
+	"""
+	
+	def __init__(self):
+		self._entries: Dict[str, Tuple[float, Any]] = {}
+		self._flights: Dict[str, _Flight] = {}
+		self._lock = threading.Lock()
+	
+	def get(self, key: str, ttl: float, producer: Callable[[], Union[_T, _Uncached[_T]]]) -> _T:
+		"""
+		Return the cached value for key, calling producer if missing or expired
+		
+		@param key: Cache key
+		@param ttl: Time-to-live in seconds
+		@param producer: Function computing the value on a cache miss; wrap the
+			value in _Uncached to return it without caching
+		@return: Cached or freshly produced value
+		"""
+		with self._lock:
+			entry = self._entries.get(key)
+			if entry and time.monotonic() - entry[0] < ttl:
+				return entry[1]
+			flight = self._flights.get(key)
+			producing = flight is None
+			if producing:
+				flight = self._flights[key] = _Flight()
+		
+		if not producing:
+			flight.done.wait()
+			if flight.failed:
+				# The producer raised; try again with our own
+				return self.get(key, ttl, producer)
+			return flight.value
+		
+		try:
+			value = producer()
+		except BaseException:
+			flight.failed = True
+			raise
+		else:
+			flight.value = value.value if isinstance(value, _Uncached) else value
+			with self._lock:
+				if not isinstance(value, _Uncached):
+					self._entries[key] = (time.monotonic(), value)
+			return flight.value
+		finally:
+			with self._lock:
+				self._flights.pop(key, None)
+			flight.done.set()
+	
+	def peek(self, key: str, ttl: float) -> Any:
+		"""Return the cached value for key without producing it, or _MISSING"""
+		with self._lock:
+			entry = self._entries.get(key)
+		if entry and time.monotonic() - entry[0] < ttl:
+			return entry[1]
+		return _MISSING
+	
+	def invalidate(self, key: Optional[str] = None):
+		"""Drop one cached entry, or all entries if key is None"""
+		with self._lock:
+			if key is None:
+				self._entries.clear()
+			else:
+				self._entries.pop(key, None)
+
+
+class _Detection:
+	"""
+	Cancellation token of one detection run
+	
+	Used as a context manager, which registers the run for cancel_detection().
+	The socket pair makes a cancel visible to the probes' select().
+	"""
+	
+	def __init__(self):
+		self._cancelled = threading.Event()
+		self.wake, self._wake_send = socket.socketpair()
+	
+	def __enter__(self) -> "_Detection":
+		with _active_detections_lock:
+			_active_detections.add(self)
+		return self
+	
+	def __exit__(self, *exc_info):
+		with _active_detections_lock:
+			_active_detections.discard(self)
+		self.wake.close()
+		self._wake_send.close()
+	
+	@property
+	def cancelled(self) -> bool:
+		return self._cancelled.is_set()
+	
+	def cancel(self):
+		"""Abort this run, waking any probe waiting in select()"""
+		self._cancelled.set()
+		try:
+			self._wake_send.send(b"\0")
+		except OSError:
+			pass  # Already finished
+
+
+_cache = _TTLCache()
+
+# Recent connectivity probe results per "ip:port", so repeated suggestions don't re-probe
+_probe_cache = _TTLCache()
+_PROBE_CACHE_TTL = 5.0
+
+# How long a measured probe timeout is used before the RTT is measured again
+_PROBE_TIMEOUT_TTL = 300.0
+
+
+def _ttl_cached(key: str, ttl: float) -> Callable[[Callable[[], _T]], Callable[[], _T]]:
+	"""Decorator caching the result of a no-argument function in the module TTL cache"""
+	def decorator(func: Callable[[], _T]) -> Callable[[], _T]:
+		@wraps(func)
+		def wrapper() -> _T:
+			return _cache.get(key, ttl, func)
+		return wrapper
+	return decorator
+
+
+def invalidate_host_ip_cache():
+	"""Forget the cached VM host IP and probe results so the next detection probes again"""
+	_cache.invalidate("vm_host_ip")
+	_cache.invalidate("suggestions")
+	_probe_cache.invalidate()
+
 
 def get_vm_host_ip() -> Optional[str]:
 	"""
@@ -28,23 +349,47 @@ def get_vm_host_ip() -> Optional[str]:
 	
 	@return: Host IP address if detected, None otherwise
 	"""
-	
-	# Method 1: Try common VM host IP patterns
+	return _cache.get("vm_host_ip", _VM_HOST_IP_TTL, _detect_vm_host_ip)
+
+
+def cancel_detection():
+	"""Abort all running host detections immediately (e.g. on driver shutdown)"""
+	with _active_detections_lock:
+		detections = list(_active_detections)
+	for detection in detections:
+		detection.cancel()
+
+
+def _detect_vm_host_ip() -> Union[Optional[str], _Uncached[Optional[str]]]:
+	"""Run the host detection methods of get_vm_host_ip()"""
+	with _Detection() as detection:
+		host_ip = _run_vm_host_detection(detection)
+		# Don't keep the result of an aborted detection
+		return _Uncached(host_ip) if detection.cancelled else host_ip
+
+
+def _run_vm_host_detection(detection: _Detection) -> Optional[str]:
+	"""Try the detection methods in turn until one finds a host or the run is cancelled"""
+	# Method 1: Try common VM host IP patterns (probed concurrently)
 	vm_host_candidates = _get_vm_host_candidates()
-	for host_ip in vm_host_candidates:
-		if _test_host_connectivity(host_ip):
-			log.info(f"Detected VM host IP: {host_ip}")
-			return host_ip
+	host_ip = _test_hosts_concurrent(detection, vm_host_candidates)
+	if host_ip:
+		log.info(f"Detected VM host IP: {host_ip}")
+		return host_ip
+	if detection.cancelled:
+		return None
 	
 	# Method 2: Try to detect from network interfaces
 	interface_host = _detect_from_network_interfaces()
-	if interface_host and _test_host_connectivity(interface_host):
+	if interface_host and _test_host_connectivity(detection, interface_host):
 		log.info(f"Detected host IP from network interfaces: {interface_host}")
 		return interface_host
+	if detection.cancelled:
+		return None
 	
 	# Method 3: Try to detect from ARP table
 	arp_host = _detect_from_arp_table()
-	if arp_host and _test_host_connectivity(arp_host):
+	if arp_host and _test_host_connectivity(detection, arp_host):
 		log.info(f"Detected host IP from ARP table: {arp_host}")
 		return arp_host
 	
@@ -54,49 +399,58 @@ def get_vm_host_ip() -> Optional[str]:
 
 def _get_vm_host_candidates() -> List[str]:
 	"""Get list of candidate host IP addresses based on local network configuration"""
-	candidates = []
-	
 	try:
 		# Get local IP addresses
-		local_ips = _get_local_ip_addresses()
-		
-		for local_ip in local_ips:
-			try:
-				network = ipaddress.IPv4Network(f"{local_ip}/24", strict=False)
-				
-				# Common VM host IP patterns
-				host_candidates = [
-					str(network.network_address + 1),  # .1 (common for VMware, VirtualBox)
-					str(network.network_address + 2),  # .2 (alternative)
-					str(network.broadcast_address - 1),  # Last IP minus 1
-				]
-				
-				# Specific VM platform IPs
-				if "192.168" in str(network):
-					# VMware typical ranges
-					if str(network).startswith("192.168."):
-						candidates.extend([
-							"192.168.1.1",
-							"192.168.0.1",
-							"192.168.56.1",  # VirtualBox host-only
-							"192.168.137.1",  # Hyper-V
-						])
-				
-				# Filter out localhost and our own IP
-				for candidate in host_candidates:
-					if candidate != local_ip and not candidate.endswith(".0") and not candidate.endswith(".255"):
-						candidates.append(candidate)
-						
-			except (ipaddress.AddressValueError, ValueError):
-				continue
-	
+		return list(_candidates_for_local_ips(tuple(_get_local_ip_addresses())))
 	except Exception as e:
 		log.error(f"Error getting VM host candidates: {e}")
+		return []
+
+
+@lru_cache(maxsize=8)
+def _candidates_for_local_ips(local_ips: Tuple[str, ...]) -> Tuple[str, ...]:
+	"""Compute candidate host IPs for a set of local IPs (cached per set)"""
+	candidates: List[str] = []
+	seen: Set[str] = set()
+	
+	def add(candidate: str):
+		if candidate not in seen:
+			seen.add(candidate)
+			candidates.append(candidate)
+	
+	for local_ip in local_ips:
+		try:
+			address = _IPV4.unpack(socket.inet_aton(local_ip))[0]
+			
+			# Specific VM platform IPs for the private range we are in
+			for net, mask, platform_ips in _VM_HOST_NETWORKS:
+				if address & mask == net:
+					for candidate in platform_ips:
+						add(candidate)
+			
+			# Common VM host IP patterns in our /24, excluding our own IP
+			for candidate in _subnet_hosts(address):
+				if candidate != local_ip:
+					add(candidate)
+					
+		except (OSError, ValueError):
+			continue
 	
-	# Remove duplicates while preserving order
-	return list(dict.fromkeys(candidates))
+	return tuple(candidates)
+
+
+def _subnet_hosts(address: int) -> List[str]:
+	"""
+	Get the common VM host IPs of the /24 containing an address
+	
+	@param address: IPv4 address as a host-order integer
+	@return: The .1 (VMware, VirtualBox), .2 (alternative) and .254 (last host) IPs
+	"""
+	network = address & 0xFFFFFF00
+	return [socket.inet_ntoa(_IPV4.pack(network + offset)) for offset in (1, 2, 254)]
 
 
+@_ttl_cached("local_ips", 10.0)
 def _get_local_ip_addresses() -> List[str]:
 	"""Get list of local IP addresses"""
 	local_ips = []
@@ -112,23 +466,112 @@ def _get_local_ip_addresses() -> List[str]:
 		pass
 	
 	try:
-		# Method 2: Get all network interfaces
-		hostname = socket.gethostname()
-		ip_list = socket.gethostbyname_ex(hostname)[2]
-		for ip in ip_list:
-			if not ip.startswith("127.") and ip not in local_ips:
-				local_ips.append(ip)
-	except:
-		pass
+		# Method 2: Enumerate interface addresses straight from the kernel
+		if _IS_WINDOWS:
+			ip_list = _get_adapters_addresses()
+		else:
+			ip_list = _get_interface_addresses()
+	except Exception as e:
+		log.debug(f"Error enumerating interface addresses: {e}")
+		ip_list = []
+	
+	if not ip_list:
+		try:
+			# Method 3: Resolve our own hostname (may block on slow DNS)
+			hostname = socket.gethostname()
+			ip_list = socket.gethostbyname_ex(hostname)[2]
+		except:
+			pass
+	
+	for ip in ip_list:
+		if not ip.startswith("127.") and ip not in local_ips:
+			local_ips.append(ip)
 	
 	return local_ips
 
 
+def _get_adapters_addresses() -> List[str]:
+	"""
+	Enumerate IPv4 unicast addresses of all adapters (GetAdaptersAddresses)
+	
+	@return: List of IP addresses in adapter order
+	"""
+	func = ctypes.windll.iphlpapi.GetAdaptersAddresses
+	flags = _GAA_FLAG_SKIP_ANYCAST | _GAA_FLAG_SKIP_MULTICAST | _GAA_FLAG_SKIP_DNS_SERVER
+	size = ctypes.c_ulong(_GAA_INITIAL_BUFFER_SIZE)
+	
+	# The adapter list can grow between calls, so retry a few times with the size we were given
+	for _ in range(3):
+		buf = ctypes.create_string_buffer(size.value)
+		result = func(socket.AF_INET, flags, None, buf, ctypes.byref(size))
+		if result == 0:
+			break
+		if result != _ERROR_BUFFER_OVERFLOW:
+			return []
+	else:
+		return []
+	
+	ips: List[str] = []
+	adapter = ctypes.cast(buf, ctypes.POINTER(IP_ADAPTER_ADDRESSES))
+	while adapter:
+		unicast = adapter.contents.FirstUnicastAddress
+		while unicast:
+			address = unicast.contents
+			# SOCKADDR_IN: [family:2][port:2][addr:4]
+			if address.lpSockaddr and address.iSockaddrLength >= 8:
+				sockaddr = ctypes.string_at(address.lpSockaddr, 8)
+				if struct.unpack_from("<H", sockaddr)[0] == socket.AF_INET:
+					ips.append(socket.inet_ntoa(sockaddr[4:8]))
+			unicast = address.Next
+		adapter = adapter.contents.Next
+	return ips
+
+
+def _get_interface_addresses() -> List[str]:
+	"""
+	Enumerate IPv4 addresses of all interfaces (if_nameindex + SIOCGIFADDR)
+	
+	@return: List of IP addresses in interface index order
+	"""
+	import fcntl
+	
+	ips: List[str] = []
+	with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+		for _, name in socket.if_nameindex():
+			# struct ifreq: [ifr_name:16][ifr_addr:sockaddr_in]
+			ifreq = struct.pack("256s", name.encode()[:15])
+			try:
+				result = fcntl.ioctl(s.fileno(), _SIOCGIFADDR, ifreq)
+			except OSError:
+				continue  # Interface has no IPv4 address
+			ips.append(socket.inet_ntoa(result[20:24]))
+	return ips
+
+
 def _detect_from_network_interfaces() -> Optional[str]:
 	"""Try to detect host IP from network interface information"""
+	try:
+		# Read the default gateway straight from the kernel routing table
+		if _IS_WINDOWS:
+			gateway = _get_ip_forward_table_gateway()
+		else:
+			gateway = _read_proc_net_route()
+		if gateway:
+			return gateway
+	except Exception as e:
+		log.debug(f"Error reading routing table: {e}")
+	
+	# Fall back to parsing command output
+	return _detect_gateway_from_commands()
+
+
+def _detect_gateway_from_commands() -> Optional[str]:
+	"""Last-resort default gateway detection by parsing ipconfig/ip/route output"""
+	import subprocess
+	
 	try:
 		# Windows: Use ipconfig to get default gateway
-		if _is_windows():
+		if _IS_WINDOWS:
 			result = subprocess.run(
 				["ipconfig", "/all"],
 				capture_output=True,
@@ -138,8 +581,7 @@ def _detect_from_network_interfaces() -> Optional[str]:
 			
 			if result.returncode == 0:
 				# Look for default gateway
-				gateway_pattern = r"Default Gateway.*?:\s*([0-9]+\.[0-9]+\.[0-9]+\.[0-9]+)"
-				matches = re.findall(gateway_pattern, result.stdout, re.IGNORECASE)
+				matches = _RE_GATEWAY_WIN.findall(result.stdout)
 				
 				for gateway in matches:
 					if not gateway.startswith("0.") and not gateway.startswith("127."):
@@ -158,7 +600,7 @@ def _detect_from_network_interfaces() -> Optional[str]:
 				
 				if result.returncode == 0:
 					# Parse: default via X.X.X.X dev ...
-					match = re.search(r"default via ([0-9]+\.[0-9]+\.[0-9]+\.[0-9]+)", result.stdout)
+					match = _RE_IP_ROUTE.search(result.stdout)
 					if match:
 						return match.group(1)
 			except:
@@ -174,7 +616,7 @@ def _detect_from_network_interfaces() -> Optional[str]:
 				)
 				
 				if result.returncode == 0:
-					match = re.search(r"gateway: ([0-9]+\.[0-9]+\.[0-9]+\.[0-9]+)", result.stdout)
+					match = _RE_ROUTE_GET.search(result.stdout)
 					if match:
 						return match.group(1)
 			except:
@@ -189,33 +631,43 @@ def _detect_from_network_interfaces() -> Optional[str]:
 def _detect_from_arp_table() -> Optional[str]:
 	"""Try to detect host IP from ARP table"""
 	try:
-		if _is_windows():
-			result = subprocess.run(
-				["arp", "-a"],
-				capture_output=True,
-				text=True,
-				timeout=10
-			)
+		# Read the neighbour cache straight from the kernel
+		if _IS_WINDOWS:
+			arp_ips = _get_ip_net_table()
 		else:
-			result = subprocess.run(
-				["arp", "-a"],
-				capture_output=True,
-				text=True,
-				timeout=10
-			)
+			arp_ips = _read_proc_net_arp()
+		for host_ip in arp_ips:
+			if _is_arp_host_candidate(host_ip):
+				return host_ip
+	except Exception as e:
+		log.debug(f"Error reading ARP table: {e}")
+	
+	# Fall back to parsing command output
+	return _detect_arp_from_command()
+
+
+def _detect_arp_from_command() -> Optional[str]:
+	"""Last-resort ARP table detection by parsing 'arp -a' output"""
+	import subprocess
+	
+	try:
+		result = subprocess.run(
+			["arp", "-a"],
+			capture_output=True,
+			text=True,
+			timeout=10
+		)
 		
 		if result.returncode == 0:
 			# Look for entries that might be the host
 			lines = result.stdout.split('\n')
 			for line in lines:
 				# Look for .1 addresses (common host IPs)
-				if re.search(r'\b\d+\.\d+\.\d+\.1\b', line):
-					match = re.search(r'(\d+\.\d+\.\d+\.1)', line)
-					if match:
-						host_ip = match.group(1)
-						# Exclude obvious non-host IPs
-						if not host_ip.startswith(("127.", "169.254.")):
-							return host_ip
+				match = _RE_ARP_DOT1.search(line)
+				if match:
+					host_ip = match.group(1)
+					if _is_arp_host_candidate(host_ip):
+						return host_ip
 	
 	except Exception as e:
 		log.debug(f"Error detecting from ARP table: {e}")
@@ -223,38 +675,270 @@ def _detect_from_arp_table() -> Optional[str]:
 	return None
 
 
-def _test_host_connectivity(host_ip: str, port: int = 17635) -> bool:
+def _is_arp_host_candidate(host_ip: str) -> bool:
+	"""Check if an ARP entry looks like a VM host (.1 address, excluding obvious non-host IPs)"""
+	return host_ip.endswith(".1") and not host_ip.startswith(("127.", "169.254."))
+
+
+def _hex_to_ip(value: str) -> str:
+	"""Convert a hex address from /proc/net to dotted-quad notation"""
+	# The kernel prints the network-order address as a host-order integer
+	return socket.inet_ntoa(_NATIVE_U32.pack(int(value, 16)))
+
+
+def _read_proc_net_route() -> Optional[str]:
+	"""
+	Read the default gateway from /proc/net/route
+	
+	@return: Gateway IP of the first default route, None if there is none
+	"""
+	with open("/proc/net/route", "r") as f:
+		next(f)  # Skip header
+		for line in f:
+			fields = line.split()
+			if len(fields) < 4:
+				continue
+			# Columns: Iface Destination Gateway Flags ...
+			destination, gateway, flags = fields[1], fields[2], int(fields[3], 16)
+			if int(destination, 16) == 0 and flags & _RTF_UP and flags & _RTF_GATEWAY:
+				return _hex_to_ip(gateway)
+	return None
+
+
+def _read_proc_net_arp() -> List[str]:
+	"""
+	Read Ethernet neighbour IPs from /proc/net/arp
+	
+	@return: List of IP addresses with a resolved Ethernet hardware address
+	"""
+	ips: List[str] = []
+	with open("/proc/net/arp", "r") as f:
+		next(f)  # Skip header
+		for line in f:
+			fields = line.split()
+			# Columns: IP-address HW-type Flags HW-address Mask Device
+			if len(fields) >= 3 and int(fields[1], 16) == _ARPHRD_ETHER and int(fields[2], 16) & _ATF_COM:
+				ips.append(fields[0])
+	return ips
+
+
+def _read_iphlpapi_table(func_name: str, row_type: type) -> list:
+	"""
+	Call an iphlpapi Get*Table function and return its rows
+	
+	@param func_name: Name of the iphlpapi function (e.g. "GetIpForwardTable")
+	@param row_type: ctypes structure describing one row of the table
+	@return: List of row structures
+	"""
+	func = getattr(ctypes.windll.iphlpapi, func_name)
+	size = ctypes.c_ulong(0)
+	result = func(None, ctypes.byref(size), False)
+	if result != _ERROR_INSUFFICIENT_BUFFER:
+		return []
+	
+	buf = ctypes.create_string_buffer(size.value)
+	if func(buf, ctypes.byref(size), False) != 0:
+		return []
+	
+	# Table layout: [dwNumEntries:DWORD][rows...]
+	num_entries = ctypes.c_uint32.from_buffer(buf).value
+	rows = (row_type * num_entries).from_buffer(buf, ctypes.sizeof(ctypes.c_uint32))
+	return list(rows)
+
+
+def _get_ip_forward_table_gateway() -> Optional[str]:
+	"""Read the default gateway from the Windows IP routing table (GetIpForwardTable)"""
+	for row in _read_iphlpapi_table("GetIpForwardTable", MIB_IPFORWARDROW):
+		if row.dwForwardDest == 0 and row.dwForwardNextHop != 0:
+			gateway = socket.inet_ntoa(_NATIVE_U32.pack(row.dwForwardNextHop))
+			if not gateway.startswith(("0.", "127.")):
+				return gateway
+	return None
+
+
+def _get_ip_net_table() -> List[str]:
+	"""Read neighbour IPs from the Windows ARP table (GetIpNetTable)"""
+	ips: List[str] = []
+	for row in _read_iphlpapi_table("GetIpNetTable", MIB_IPNETROW):
+		if row.dwType in (_MIB_IPNET_TYPE_DYNAMIC, _MIB_IPNET_TYPE_STATIC):
+			ips.append(socket.inet_ntoa(_NATIVE_U32.pack(row.dwAddr)))
+	return ips
+
+
+def probe_hosts(host_ips: List[str], port: int = 17635) -> Optional[str]:
+	"""
+	Find the first of several host IPs with a RemBraille server, probing all at once
+	
+	@param host_ips: IP addresses to test, duplicates are ignored
+	@param port: Port to test (default: RemBraille port)
+	@return: First IP that accepted the connection, None if none did
+	"""
+	with _Detection() as detection:
+		return _test_hosts_concurrent(detection, list(dict.fromkeys(host_ips)), port)
+
+
+def _test_host_connectivity(detection: _Detection, host_ip: str, port: int = 17635) -> bool:
 	"""
 	Test if the host IP has a RemBraille server running
 	
+	@param detection: Detection run the test belongs to
 	@param host_ip: IP address to test
 	@param port: Port to test (default: RemBraille port)
 	@return: True if connection possible, False otherwise
 	"""
+	def probe() -> Union[bool, _Uncached[bool]]:
+		connected = _connect_with_timeout(detection, host_ip, port, _get_probe_timeout(detection)) is True
+		return _Uncached(connected) if detection.cancelled else connected
+	
+	return _probe_cache.get(f"{host_ip}:{port}", _PROBE_CACHE_TTL, probe)
+
+
+def _connect_with_timeout(detection: _Detection, host_ip: str, port: int, timeout: float) -> Optional[bool]:
+	"""
+	Non-blocking TCP connect attempt
+	
+	@return: True if connected, False if refused, failed or cancelled, None on timeout
+	"""
+	error = _connect_error(detection, host_ip, port, timeout)
+	if error is None:
+		return False if detection.cancelled else None
+	return error == 0
+
+
+def _connect_error(detection: _Detection, host_ip: str, port: int, timeout: float) -> Optional[int]:
+	"""
+	Non-blocking TCP connect attempt reporting the socket error
+	
+	@return: 0 if connected, the error number if refused or failed, None on timeout or cancel
+	"""
 	try:
+		wake = detection.wake
 		with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-			sock.settimeout(2.0)  # Short timeout for detection
+			sock.setblocking(False)
 			result = sock.connect_ex((host_ip, port))
-			return result == 0
-	except:
-		return False
+			if result not in _CONNECT_IN_PROGRESS:
+				return result
+			
+			cancelled, writable, failed = select.select([wake], [sock], [sock], timeout)
+			if cancelled or (not writable and not failed):
+				return None
+			# Windows reports failed connects in the exception set, with the error in SO_ERROR
+			error = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+			return error or (errno.ECONNABORTED if failed else 0)
+	except OSError as e:
+		return e.errno or errno.EIO
+	except Exception:
+		return errno.EIO
+
+
+def _get_probe_timeout(detection: _Detection) -> float:
+	"""Get the connect timeout for host probes, measured once per _PROBE_TIMEOUT_TTL"""
+	return _cache.get("probe_timeout", _PROBE_TIMEOUT_TTL, lambda: _measure_probe_timeout(detection))
 
 
-def _is_windows() -> bool:
-	"""Check if running on Windows"""
-	import platform
-	return platform.system().lower() == "windows"
+def _measure_probe_timeout(detection: _Detection) -> Union[float, _Uncached[float]]:
+	"""
+	Compute the connect timeout for host probes, adapted to the local network RTT
+	
+	The RTT is measured with a connect to the default gateway; a refused
+	connect answers just as fast as an accepted one. Only an accepted or
+	refused connect counts as a measurement: without one the conservative
+	maximum timeout is used, and not cached, so the next probe measures again.
+	
+	@return: Timeout in seconds
+	"""
+	gateway = _detect_from_network_interfaces()
+	if not gateway:
+		return _Uncached(_MAX_PROBE_TIMEOUT)
+	
+	start = time.perf_counter()
+	error = _connect_error(detection, gateway, 17635, _MAX_PROBE_TIMEOUT)
+	rtt = time.perf_counter() - start
+	if (error != 0 and error not in _CONNECT_REFUSED) or detection.cancelled:
+		return _Uncached(_MAX_PROBE_TIMEOUT)
+	
+	timeout = min(_MAX_PROBE_TIMEOUT, max(_MIN_PROBE_TIMEOUT, 4 * rtt))
+	log.debug(f"Host probe timeout {timeout * 1000:.0f} ms (gateway RTT {rtt * 1000:.1f} ms)")
+	return timeout
 
 
+def _test_hosts_concurrent(
+	detection: _Detection,
+	host_ips: List[str],
+	port: int = 17635,
+	timeout: Optional[float] = None
+) -> Optional[str]:
+	"""
+	Test several host IPs at once and return the first one with a RemBraille server
+	
+	All connects are started non-blocking and awaited with a single select loop,
+	so the total wait is bounded by one timeout instead of one per candidate.
+	
+	@param detection: Detection run the probes belong to
+	@param host_ips: IP addresses to test
+	@param port: Port to test (default: RemBraille port)
+	@param timeout: Overall timeout in seconds (default: adaptive probe timeout)
+	@return: First IP that accepted the connection, None if none did
+	"""
+	if timeout is None:
+		timeout = _get_probe_timeout(detection)
+	
+	pending: Dict[socket.socket, str] = {}
+	try:
+		wake = detection.wake
+		for host_ip in host_ips:
+			sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+			sock.setblocking(False)
+			try:
+				result = sock.connect_ex((host_ip, port))
+			except OSError:
+				sock.close()
+				continue
+			if result == 0:
+				sock.close()
+				return host_ip
+			if result in _CONNECT_IN_PROGRESS:
+				pending[sock] = host_ip
+			else:
+				sock.close()
+		
+		deadline = time.monotonic() + timeout
+		while pending:
+			remaining = deadline - time.monotonic()
+			if remaining <= 0:
+				break
+			socks = list(pending)
+			# Windows reports failed connects in the exception set, others in the write set
+			cancelled, writable, failed = select.select([wake], socks, socks, remaining)
+			if cancelled:
+				break
+			for sock in set(writable) | set(failed):
+				host_ip = pending.pop(sock)
+				error = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+				sock.close()
+				if error == 0 and sock not in failed:
+					return host_ip
+	except Exception as e:
+		log.debug(f"Error probing host candidates: {e}")
+	finally:
+		for sock in pending:
+			sock.close()
+	
+	return None
+
+
+@_ttl_cached("vm_platform", _VM_PLATFORM_TTL)
 def get_vm_platform() -> Optional[str]:
 	"""
 	Try to detect which VM platform we're running on
 	
 	@return: VM platform name ("vmware", "virtualbox", "parallels", "hyper-v") or None
 	"""
+	import subprocess
+	
 	try:
 		# Check for VM indicators in system information
-		if _is_windows():
+		if _IS_WINDOWS:
 			# Check Windows system info
 			result = subprocess.run(
 				["systeminfo"],
@@ -301,51 +985,61 @@ def suggest_host_ips() -> List[Tuple[str, str]]:
 	"""
 	Get a list of suggested host IPs with descriptions
 	
+	Returns immediately: the auto-detected IP and VM platform are only used once
+	cached, otherwise they are detected in the background for the next call.
+	
 	@return: List of (ip, description) tuples
 	"""
-	suggestions = []
+	return list(_cache.get("suggestions", _SUGGESTIONS_TTL, _build_suggestions))
+
+
+def _build_suggestions() -> List[Tuple[str, str]]:
+	"""Build the host IP suggestions from the static lists and cached detection results"""
+	auto_ip = _cache.peek("vm_host_ip", _VM_HOST_IP_TTL)
+	platform = _cache.peek("vm_platform", _VM_PLATFORM_TTL)
+	if auto_ip is _MISSING or platform is _MISSING:
+		_start_suggestion_refresh()
 	
 	# Add localhost first for debugging
-	suggestions.append(("127.0.0.1", "Localhost (for debugging/testing)"))
+	suggestions = [_LOCALHOST_SUGGESTION]
 	
 	# Add automatically detected IP if available
-	auto_ip = get_vm_host_ip()
-	if auto_ip:
+	if auto_ip and auto_ip is not _MISSING:
 		suggestions.append((auto_ip, "Auto-detected VM host"))
 	
-	# Add common VM host IPs
-	platform = get_vm_platform()
-	
-	common_ips = [
-		("192.168.1.1", "Common router/host IP"),
-		("192.168.0.1", "Common router/host IP"),
-		("192.168.56.1", "VirtualBox host-only adapter"),
-		("192.168.137.1", "Windows Hyper-V"),
-		("10.0.2.2", "VirtualBox NAT gateway"),
-		("172.16.0.1", "VMware host IP"),
-	]
-	
 	# Platform-specific suggestions
-	if platform == "vmware":
-		suggestions.extend([
-			("192.168.142.1", "VMware Workstation host"),
-			("192.168.91.1", "VMware Fusion host"),
-		])
-	elif platform == "virtualbox":
-		suggestions.extend([
-			("192.168.56.1", "VirtualBox host-only"),
-			("10.0.2.2", "VirtualBox NAT gateway"),
-		])
-	elif platform == "parallels":
-		suggestions.extend([
-			("10.211.55.2", "Parallels shared networking"),
-			("192.168.1.1", "Parallels bridged networking"),
-		])
+	suggestions.extend(_PLATFORM_SUGGESTIONS.get(platform, ()))
 	
 	# Add common IPs (avoiding duplicates)
 	existing_ips = {ip for ip, _ in suggestions}
-	for ip, desc in common_ips:
+	for ip, desc in _COMMON_SUGGESTIONS:
 		if ip not in existing_ips:
 			suggestions.append((ip, desc))
 	
-	return suggestions
\ No newline at end of file
+	return suggestions
+
+
+def _start_suggestion_refresh():
+	"""Detect the VM host IP and platform in a background thread, once at a time"""
+	global _suggestion_refresh_thread
+	with _suggestion_refresh_lock:
+		if _suggestion_refresh_thread and _suggestion_refresh_thread.is_alive():
+			return
+		_suggestion_refresh_thread = threading.Thread(
+			target=_refresh_suggestions,
+			name="RemBrailleSuggestions",
+			daemon=True
+		)
+		_suggestion_refresh_thread.start()
+
+
+def _refresh_suggestions():
+	"""Populate the detection caches used by suggest_host_ips()"""
+	try:
+		get_vm_platform()
+		get_vm_host_ip()
+	except Exception as e:
+		log.debug(f"Error refreshing host suggestions: {e}")
+	finally:
+		# Rebuild the suggestions with the detection results
+		_cache.invalidate("suggestions")
@@ -8,24 +8,36 @@ RemBraille Communication Protocol
 Handles TCP socket communication between NVDA guest and host braille display
 """
 
+import selectors
 import socket
 import struct
+import sys
 import threading
 import time
-from typing import Optional, Callable, List, Tuple, Union
+from typing import Optional, Callable, Dict, List, Tuple, Union
 from logHandler import log
-import queue
+
+from ._hostDetection import invalidate_host_ip_cache
 
 # Protocol constants
 REMBRAILLE_PORT = 17635  # Unique port for RemBraille
 PROTOCOL_VERSION = 1
 TIMEOUT = 5.0
 RECONNECT_DELAY = 3.0
+PING_INTERVAL = 10.0
+MAX_MESSAGE_SIZE = 4 + 0xFFFF  # Header plus the largest 16-bit length payload
+SEND_BUFFER_SIZE = 1024  # Header plus the largest common display line
+
+# Scatter-gather send is not available on Windows
+_HAS_SENDMSG = hasattr(socket.socket, "sendmsg")
+# Windows equivalent of TCP_USER_TIMEOUT, in whole seconds (mstcpip.h); not exported by the socket module
+_TCP_MAXRT = 5
 
 # Message types
 MSG_HANDSHAKE = 0x01
 MSG_HANDSHAKE_RESP = 0x02
 MSG_DISPLAY_CELLS = 0x10
+MSG_DISPLAY_CELLS_DELTA = 0x11
 MSG_KEY_EVENT = 0x20
 MSG_NUM_CELLS_REQ = 0x30
 MSG_NUM_CELLS_RESP = 0x31
@@ -33,6 +45,21 @@ MSG_PING = 0x40
 MSG_PONG = 0x41
 MSG_ERROR = 0xFF
 
+# Precompiled wire formats
+_HEADER = struct.Struct("!BBH")  # version, type, payload length
+_CELL_COUNT = struct.Struct("!H")  # num-cells response / delta change count
+_CELL_CHANGE = struct.Struct("!HB")  # delta entry: cell index, value
+_KEY_EVENT = struct.Struct("!HB")  # key id, event type
+
+# Requests that never change, serialized once
+_CLIENT_NAME = b"NVDA_RemBraille_Client"
+_HANDSHAKE_FRAME = _HEADER.pack(PROTOCOL_VERSION, MSG_HANDSHAKE, len(_CLIENT_NAME)) + _CLIENT_NAME
+_NUM_CELLS_REQ_FRAME = _HEADER.pack(PROTOCOL_VERSION, MSG_NUM_CELLS_REQ, 0)
+_PING_FRAME = _HEADER.pack(PROTOCOL_VERSION, MSG_PING, 0)
+
+# Host capabilities, advertised as ";"-separated tokens after the handshake response text
+CAP_DISPLAY_CELLS_DELTA = b"delta"
+
 # Key event types
 KEY_DOWN = 0x01
 KEY_UP = 0x02
@@ -41,16 +68,20 @@ KEY_UP = 0x02
 class RemBrailleMessage:
 	"""Represents a RemBraille protocol message"""
 	
+	__slots__ = ("msg_type", "data", "length")
+	
 	def __init__(self, msg_type: int, data: bytes = b""):
 		self.msg_type = msg_type
 		self.data = data
 		self.length = len(data)
 	
-	def serialize(self) -> bytes:
+	def serialize(self) -> bytearray:
 		"""Serialize message to bytes for transmission"""
-		# Header: [version:1][type:1][length:2][data:n]
-		header = struct.pack("!BBH", PROTOCOL_VERSION, self.msg_type, self.length)
-		return header + self.data
+		# Header: [version:1][type:1][length:2][data:n], packed into one allocation
+		buf = bytearray(4 + self.length)
+		_HEADER.pack_into(buf, 0, PROTOCOL_VERSION, self.msg_type, self.length)
+		buf[4:] = self.data
+		return buf
 	
 	@classmethod
 	def deserialize(cls, data: bytes) -> Optional["RemBrailleMessage"]:
@@ -58,7 +89,7 @@ class RemBrailleMessage:
 		if len(data) < 4:
 			return None
 		
-		version, msg_type, length = struct.unpack("!BBH", data[:4])
+		version, msg_type, length = _HEADER.unpack_from(data, 0)
 		if version != PROTOCOL_VERSION:
 			log.error(f"Unsupported protocol version: {version}")
 			return None
@@ -82,13 +113,29 @@ class RemBrailleCom:
 	- Managing connection state and reconnection
 	"""
 	
-	def __init__(self, on_key_event: Optional[Callable[[int, bool], None]] = None):
+	def __init__(
+		self,
+		on_key_event: Optional[Callable[[int, bool], None]] = None,
+		socket_opts: Optional[Dict[str, int]] = None,
+		auto_reconnect: bool = True,
+		on_connection_lost: Optional[Callable[[], None]] = None
+	):
 		"""
 		Initialize RemBraille communication
 		
 		@param on_key_event: Callback function for key events (key_id, is_pressed)
+		@param socket_opts: TCP tuning applied on connect: "TCP_NODELAY" (default 1) and
+			"TCP_USER_TIMEOUT" in milliseconds (TCP_MAXRT on Windows), after which
+			unacknowledged data drops the connection
+		@param auto_reconnect: Reconnect every RECONNECT_DELAY seconds after the connection
+			is lost; pass False when the caller schedules reconnections itself
+		@param on_connection_lost: Callback for a lost connection (called on the thread
+			that noticed the loss)
 		"""
 		self.on_key_event = on_key_event
+		self.on_connection_lost = on_connection_lost
+		self.auto_reconnect = auto_reconnect
+		self.socket_opts: Dict[str, int] = dict(socket_opts or {})
 		self.socket: Optional[socket.socket] = None
 		self.connected = False
 		self.host_ip: Optional[str] = None
@@ -98,13 +145,39 @@ class RemBrailleCom:
 		# Threading
 		self._stop_event = threading.Event()
 		self._receive_thread: Optional[threading.Thread] = None
-		self._ping_thread: Optional[threading.Thread] = None
-		self._message_queue = queue.Queue()
+		self._wake_recv: Optional[socket.socket] = None
+		self._wake_send: Optional[socket.socket] = None
 		
 		# Connection management
-		self._reconnect_timer: Optional[threading.Timer] = None
+		self._reconnect_thread: Optional[threading.Thread] = None
+		self._reconnect_event = threading.Event()
+		self._reconnect_stop = threading.Event()
 		self._last_ping_time = 0.0
 		
+		# Send buffers, reused for every message
+		self._send_hdr = bytearray(4)
+		self._send_buf = bytearray(SEND_BUFFER_SIZE)
+		self._send_view = memoryview(self._send_buf)
+		self._send_lock = threading.Lock()
+		
+		# Receive buffers, reused for every message
+		self._hdr_buf = bytearray(4)
+		self._hdr_view = memoryview(self._hdr_buf)
+		self._rx_buf = bytearray(MAX_MESSAGE_SIZE)
+		self._rx_view = memoryview(self._rx_buf)
+		self._rx_len = 0
+		
+		# Delta encoding of display frames, if the host supports it
+		self._delta_supported = False
+		self._last_cells = bytearray()
+		
+		# Message type -> handler(payload) for messages from the receive loop
+		self._dispatch: Dict[int, Callable[[memoryview], None]] = {
+			MSG_KEY_EVENT: self._handle_key_event,
+			MSG_PONG: self._handle_pong,
+			MSG_ERROR: self._handle_error,
+		}
+		
 	def connect(self, host_ip: str, port: int = REMBRAILLE_PORT) -> bool:
 		"""
 		Connect to RemBraille host server
@@ -113,6 +186,9 @@ class RemBrailleCom:
 		@param port: Port number (default: REMBRAILLE_PORT)
 		@return: True if connection successful, False otherwise
 		"""
+		# Never leave an earlier socket or receive thread behind
+		self._close()
+		
 		self.host_ip = host_ip
 		self.port = port
 		
@@ -124,30 +200,33 @@ class RemBrailleCom:
 			# Connect to host
 			log.info(f"Connecting to RemBraille host at {host_ip}:{port}")
 			self.socket.connect((host_ip, port))
+			self._configure_socket(self.socket)
 			
 			# Send handshake
-			handshake = RemBrailleMessage(MSG_HANDSHAKE, b"NVDA_RemBraille_Client")
-			self._send_message(handshake)
+			self._send_frame(_HANDSHAKE_FRAME)
 			
 			# Wait for handshake response
 			response = self._receive_message()
 			if not response or response.msg_type != MSG_HANDSHAKE_RESP:
 				log.error("Handshake failed")
-				self.disconnect()
+				self._close()
 				return False
 			
+			capabilities = response.data.split(b";")[1:]
+			self._delta_supported = CAP_DISPLAY_CELLS_DELTA in capabilities
+			self._last_cells = bytearray()
+			
 			# Request number of cells
-			cells_req = RemBrailleMessage(MSG_NUM_CELLS_REQ)
-			self._send_message(cells_req)
+			self._send_frame(_NUM_CELLS_REQ_FRAME)
 			
 			# Wait for cells response
 			cells_resp = self._receive_message()
 			if not cells_resp or cells_resp.msg_type != MSG_NUM_CELLS_RESP:
 				log.error("Failed to get number of cells")
-				self.disconnect()
+				self._close()
 				return False
 			
-			self.num_cells = struct.unpack("!H", cells_resp.data)[0]
+			self.num_cells = _CELL_COUNT.unpack(cells_resp.data)[0]
 			log.info(f"Connected to RemBraille host with {self.num_cells} cells")
 			
 			self.connected = True
@@ -159,11 +238,37 @@ class RemBrailleCom:
 			
 		except Exception as e:
 			log.error(f"Failed to connect to RemBraille host: {e}")
-			self.disconnect()
+			self._close()
 			return False
 	
+	def _configure_socket(self, sock: socket.socket):
+		"""Tune the connected socket for small, latency-sensitive messages"""
+		try:
+			# Send each braille frame immediately instead of waiting for Nagle coalescing
+			sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, self.socket_opts.get("TCP_NODELAY", 1))
+			sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+		except OSError as e:
+			log.debug(f"Could not set socket options: {e}")
+		
+		user_timeout = self.socket_opts.get("TCP_USER_TIMEOUT")
+		if user_timeout:
+			try:
+				# Give up on a stalled link instead of retransmitting for minutes
+				if hasattr(socket, "TCP_USER_TIMEOUT"):
+					sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_USER_TIMEOUT, user_timeout)
+				elif sys.platform == "win32":
+					sock.setsockopt(socket.IPPROTO_TCP, _TCP_MAXRT, max(1, -(-user_timeout // 1000)))
+			except OSError as e:
+				log.debug(f"Could not set TCP user timeout: {e}")
+	
 	def disconnect(self):
 		"""Disconnect from RemBraille host"""
+		self._stop_reconnect_worker()
+		self._close()
+		log.info("Disconnected from RemBraille host")
+	
+	def _close(self):
+		"""Close the connection without stopping automatic reconnection"""
 		self.connected = False
 		self._stop_threads()
 		
@@ -173,41 +278,96 @@ class RemBrailleCom:
 			except:
 				pass
 			self.socket = None
-		
-		if self._reconnect_timer:
-			self._reconnect_timer.cancel()
-			self._reconnect_timer = None
-		
-		log.info("Disconnected from RemBraille host")
 	
-	def display_cells(self, cells: List[int]) -> bool:
+	def display_cells(self, cells: Union[bytes, bytearray, memoryview, List[int]]) -> bool:
 		"""
 		Send braille cells to display
 		
-		@param cells: List of braille cell values (0-255)
+		@param cells: Braille cell values (0-255); bytes-like input is sent without conversion
 		@return: True if sent successfully, False otherwise
 		"""
 		if not self.connected or not self.socket:
 			return False
 		
 		try:
-			# Pack cells as bytes
-			cell_data = bytes(cells)
-			message = RemBrailleMessage(MSG_DISPLAY_CELLS, cell_data)
-			return self._send_message(message)
+			# Pack cells as bytes and send without a message wrapper
+			cell_data = cells if isinstance(cells, (bytes, bytearray, memoryview)) else bytes(cells)
+			if self._delta_supported and len(cell_data) == len(self._last_cells):
+				delta = self._encode_delta(cell_data)
+				self._last_cells[:] = cell_data
+				if delta is not None:
+					return self._send_raw(MSG_DISPLAY_CELLS_DELTA, delta)
+			else:
+				self._last_cells[:] = cell_data
+			return self._send_raw(MSG_DISPLAY_CELLS, cell_data)
 		except Exception as e:
 			log.error(f"Failed to send braille cells: {e}")
 			self._handle_connection_error()
 			return False
 	
-	def _send_message(self, message: RemBrailleMessage) -> bool:
-		"""Send a message to the host"""
+	def _encode_delta(self, cell_data: bytes) -> Optional[bytes]:
+		"""
+		Encode the cells that changed since the last frame
+		
+		Payload: [count:2] followed by count entries of [index:2][value:1]
+		
+		@param cell_data: New frame, same length as the last sent frame
+		@return: Delta payload, or None if a full frame is smaller
+		"""
+		last = self._last_cells
+		changed = [i for i, cell in enumerate(cell_data) if cell != last[i]]
+		if 2 + 3 * len(changed) >= len(cell_data):
+			return None
+		
+		delta = bytearray(2 + 3 * len(changed))
+		_CELL_COUNT.pack_into(delta, 0, len(changed))
+		offset = 2
+		for index in changed:
+			_CELL_CHANGE.pack_into(delta, offset, index, cell_data[index])
+			offset += 3
+		return bytes(delta)
+	
+	def _send_frame(self, frame: bytes) -> bool:
+		"""Send an already serialized message to the host"""
+		if not self.socket:
+			return False
+		
+		try:
+			with self._send_lock:
+				self.socket.sendall(frame)
+			return True
+		except Exception as e:
+			log.error(f"Failed to send message: {e}")
+			self._handle_connection_error()
+			return False
+	
+	def _send_raw(self, msg_type: int, data: bytes) -> bool:
+		"""Send a message to the host without building a message object"""
 		if not self.socket:
 			return False
 		
 		try:
-			data = message.serialize()
-			self.socket.sendall(data)
+			length = len(data)
+			total = 4 + length
+			with self._send_lock:
+				if _HAS_SENDMSG and length:
+					# Gather-write header and payload in one syscall, no concatenation
+					_HEADER.pack_into(self._send_hdr, 0, PROTOCOL_VERSION, msg_type, length)
+					sent = self.socket.sendmsg([self._send_hdr, data])
+					if sent < total:
+						# Finish the frame from the two buffers, still without joining them
+						if sent < 4:
+							self.socket.sendall(self._send_hdr[sent:])
+							sent = 4
+						self.socket.sendall(memoryview(data)[sent - 4:])
+				elif total <= len(self._send_buf):
+					# Pack into the reusable send buffer
+					buf = self._send_buf
+					_HEADER.pack_into(buf, 0, PROTOCOL_VERSION, msg_type, length)
+					buf[4:total] = data
+					self.socket.sendall(self._send_view[:total])
+				else:
+					self.socket.sendall(RemBrailleMessage(msg_type, data).serialize())
 			return True
 		except Exception as e:
 			log.error(f"Failed to send message: {e}")
@@ -220,12 +380,11 @@ class RemBrailleCom:
 			return None
 		
 		try:
-			# Read header
-			header_data = self._receive_exact(4)
-			if not header_data:
+			# Read header into the persistent header buffer
+			if not self._receive_into(self._hdr_view):
 				return None
 			
-			version, msg_type, length = struct.unpack("!BBH", header_data)
+			version, msg_type, length = _HEADER.unpack_from(self._hdr_buf)
 			if version != PROTOCOL_VERSION:
 				log.error(f"Unsupported protocol version: {version}")
 				return None
@@ -246,122 +405,212 @@ class RemBrailleCom:
 	
 	def _receive_exact(self, length: int) -> Optional[bytes]:
 		"""Receive exactly the specified number of bytes"""
-		if not self.socket:
+		# Only used before the receive loop owns the persistent receive buffer
+		view = self._rx_view[:length]
+		if not self._receive_into(view):
 			return None
+		return bytes(view)
+	
+	def _receive_into(self, view: memoryview) -> bool:
+		"""Fill the given buffer view completely from the socket"""
+		if not self.socket:
+			return False
 		
-		data = b""
-		while len(data) < length:
+		offset = 0
+		length = len(view)
+		while offset < length:
 			try:
-				chunk = self.socket.recv(length - len(data))
-				if not chunk:
-					return None  # Connection closed
-				data += chunk
-			except socket.timeout:
-				continue
+				received = self.socket.recv_into(view[offset:])
+				if not received:
+					return False  # Connection closed
+				offset += received
 			except Exception:
-				return None
+				return False
 		
-		return data
+		return True
 	
 	def _start_threads(self):
 		"""Start background threads for communication"""
 		self._stop_event.clear()
 		
+		# Socket pair used to wake the receive thread's selector on stop
+		self._wake_recv, self._wake_send = socket.socketpair()
+		
 		# Start receive thread
 		self._receive_thread = threading.Thread(target=self._receive_loop, daemon=True)
 		self._receive_thread.start()
-		
-		# Start ping thread
-		self._ping_thread = threading.Thread(target=self._ping_loop, daemon=True)
-		self._ping_thread.start()
 	
 	def _stop_threads(self):
 		"""Stop background threads"""
 		self._stop_event.set()
 		
-		if self._receive_thread and self._receive_thread.is_alive():
-			self._receive_thread.join(timeout=1.0)
+		if self._wake_send:
+			try:
+				self._wake_send.send(b"\0")
+			except OSError:
+				pass
 		
-		if self._ping_thread and self._ping_thread.is_alive():
-			self._ping_thread.join(timeout=1.0)
+		thread = self._receive_thread
+		if thread and thread.is_alive() and thread is not threading.current_thread():
+			thread.join(timeout=1.0)
+		self._receive_thread = None
+		
+		for wake_sock in (self._wake_recv, self._wake_send):
+			if wake_sock:
+				wake_sock.close()
+		self._wake_recv = self._wake_send = None
 	
 	def _receive_loop(self):
-		"""Background thread for receiving messages"""
-		while not self._stop_event.is_set() and self.connected:
-			try:
-				message = self._receive_message()
-				if not message:
-					continue
-				
-				self._handle_message(message)
-				
-			except Exception as e:
-				if self.connected:
-					log.error(f"Error in receive loop: {e}")
-					self._handle_connection_error()
-				break
+		"""
+		Background thread for receiving messages and sending keep-alive pings
+		
+		Sleeps in a selector until data arrives or the next ping is due.
+		"""
+		self._rx_len = 0
+		next_ping_at = time.monotonic() + PING_INTERVAL
+		sock = self.socket
+		if not sock or not self._wake_recv:
+			return
+		
+		with selectors.DefaultSelector() as selector:
+			selector.register(sock, selectors.EVENT_READ)
+			selector.register(self._wake_recv, selectors.EVENT_READ)
+			
+			while not self._stop_event.is_set() and self.connected:
+				try:
+					events = selector.select(max(0.0, next_ping_at - time.monotonic()))
+					if any(key.fileobj is self._wake_recv for key, _ in events):
+						break
+					
+					now = time.monotonic()
+					if now >= next_ping_at:
+						# Keep-alive ping is due
+						self._send_frame(_PING_FRAME)
+						self._last_ping_time = time.time()
+						next_ping_at = now + PING_INTERVAL
+					if not events:
+						continue
+					
+					# Pull as much as the kernel has buffered in one syscall
+					received = sock.recv_into(self._rx_view[self._rx_len:])
+					if not received:
+						raise ConnectionError("Connection closed by host")
+					
+					self._rx_len += received
+					self._parse_received()
+					
+				except Exception as e:
+					if self.connected:
+						log.error(f"Error in receive loop: {e}")
+						self._handle_connection_error()
+					break
 	
-	def _ping_loop(self):
-		"""Background thread for sending keep-alive pings"""
-		while not self._stop_event.is_set() and self.connected:
-			try:
-				time.sleep(10.0)  # Ping every 10 seconds
-				
-				if self.connected:
-					ping_msg = RemBrailleMessage(MSG_PING)
-					self._send_message(ping_msg)
-					self._last_ping_time = time.time()
-				
-			except Exception as e:
-				if self.connected:
-					log.error(f"Error in ping loop: {e}")
-				break
+	def _parse_received(self):
+		"""Dispatch every complete message in the receive buffer and keep the partial tail"""
+		buf = self._rx_buf
+		offset = 0
+		while self._rx_len - offset >= 4:
+			version, msg_type, length = _HEADER.unpack_from(buf, offset)
+			if version != PROTOCOL_VERSION:
+				raise ValueError(f"Unsupported protocol version: {version}")
+			
+			end = offset + 4 + length
+			if end > self._rx_len:
+				break  # Wait for the rest of the message
+			
+			# Handlers consume the payload before the buffer is reused, so pass a view
+			self._handle_message(msg_type, self._rx_view[offset + 4:end])
+			offset = end
+		
+		# Move the incomplete message, if any, to the front of the buffer
+		if offset:
+			remaining = self._rx_len - offset
+			buf[:remaining] = buf[offset:self._rx_len]
+			self._rx_len = remaining
+	
+	def _handle_message(self, msg_type: int, data: memoryview):
+		"""
+		Handle received message
+		
+		@param msg_type: Message type
+		@param data: Message payload, only valid for the duration of the call
+		"""
+		handler = self._dispatch.get(msg_type)
+		if handler is None:
+			log.warning(f"Unknown message type: {msg_type}")
+			return
+		handler(data)
 	
-	def _handle_message(self, message: RemBrailleMessage):
-		"""Handle received message"""
-		if message.msg_type == MSG_KEY_EVENT:
-			# Key event: [key_id:2][event_type:1]
-			if len(message.data) >= 3:
-				key_id, event_type = struct.unpack("!HB", message.data[:3])
-				is_pressed = (event_type == KEY_DOWN)
-				
-				if self.on_key_event:
-					self.on_key_event(key_id, is_pressed)
-		
-		elif message.msg_type == MSG_PONG:
-			# Pong response - connection is alive
-			pass
-		
-		elif message.msg_type == MSG_ERROR:
-			error_msg = message.data.decode('utf-8', errors='ignore')
-			log.error(f"RemBraille host error: {error_msg}")
-		
-		else:
-			log.warning(f"Unknown message type: {message.msg_type}")
+	def _handle_key_event(self, data: memoryview):
+		"""Key event: [key_id:2][event_type:1]"""
+		if len(data) >= 3:
+			key_id, event_type = _KEY_EVENT.unpack_from(data)
+			is_pressed = (event_type == KEY_DOWN)
+			
+			if self.on_key_event:
+				self.on_key_event(key_id, is_pressed)
+	
+	def _handle_pong(self, data: memoryview):
+		"""Pong response - connection is alive"""
+		pass
+	
+	def _handle_error(self, data: memoryview):
+		"""Log an error reported by the host"""
+		error_msg = bytes(data).decode('utf-8', errors='ignore')
+		log.error(f"RemBraille host error: {error_msg}")
 	
 	def _handle_connection_error(self):
-		"""Handle connection error by scheduling reconnection"""
+		"""Handle connection error by reporting it and, if enabled, scheduling reconnection"""
 		if not self.connected:
 			return
 		
 		self.connected = False
-		log.warning("RemBraille connection lost, scheduling reconnection...")
+		log.warning("RemBraille connection lost")
+		
+		# The host may have moved, re-probe on the next detection
+		invalidate_host_ip_cache()
 		
-		# Schedule reconnection
-		if self._reconnect_timer:
-			self._reconnect_timer.cancel()
+		if self.on_connection_lost:
+			self.on_connection_lost()
 		
-		self._reconnect_timer = threading.Timer(RECONNECT_DELAY, self._attempt_reconnect)
-		self._reconnect_timer.start()
+		if self.auto_reconnect:
+			# Wake the reconnect worker
+			self._ensure_reconnect_worker()
+			self._reconnect_event.set()
 	
-	def _attempt_reconnect(self):
-		"""Attempt to reconnect to the host"""
-		if self.host_ip:
-			log.info("Attempting to reconnect to RemBraille host...")
-			if not self.connect(self.host_ip, self.port):
-				# Schedule another reconnection attempt
-				self._reconnect_timer = threading.Timer(RECONNECT_DELAY, self._attempt_reconnect)
-				self._reconnect_timer.start()
+	def _ensure_reconnect_worker(self):
+		"""Start the persistent reconnect worker thread if it is not running"""
+		if self._reconnect_thread and self._reconnect_thread.is_alive():
+			return
+		
+		self._reconnect_stop.clear()
+		self._reconnect_thread = threading.Thread(target=self._reconnect_worker, daemon=True)
+		self._reconnect_thread.start()
+	
+	def _stop_reconnect_worker(self):
+		"""Stop the reconnect worker thread"""
+		self._reconnect_stop.set()
+		self._reconnect_event.set()
+		
+		thread = self._reconnect_thread
+		if thread and thread.is_alive() and thread is not threading.current_thread():
+			thread.join(timeout=1.0)
+		self._reconnect_thread = None
+	
+	def _reconnect_worker(self):
+		"""Background thread reconnecting to the host whenever the connection is lost"""
+		while not self._reconnect_stop.is_set():
+			self._reconnect_event.wait()
+			self._reconnect_event.clear()
+			
+			while not self.connected and self.host_ip and not self._reconnect_stop.is_set():
+				if self._reconnect_stop.wait(RECONNECT_DELAY):
+					break
+				# Someone else may have reconnected (or disconnected) meanwhile
+				if self.connected or not self.host_ip:
+					break
+				log.info("Attempting to reconnect to RemBraille host...")
+				self.connect(self.host_ip, self.port)
 	
 	def is_connected(self) -> bool:
 		"""Check if connected to host"""
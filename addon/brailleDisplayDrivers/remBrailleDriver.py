@@ -8,10 +8,13 @@ RemBraille Driver for NVDA
 Provides braille display support for NVDA running in virtual machines
 """
 
+import collections
+import random
 import threading
 import time
 import wx
-from typing import List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
 
 import braille
 import inputCore
@@ -24,7 +27,52 @@ import speech
 
 # Import our RemBraille components
 from ._remBrailleCom import RemBrailleCom, REMBRAILLE_PORT
-from ._hostDetection import get_vm_host_ip, suggest_host_ips
+from ._hostDetection import cancel_detection, get_vm_host_ip, probe_hosts, suggest_host_ips
+
+# Reconnection backoff: the delay doubles per failed attempt, with +/-20% jitter
+RECONNECT_BACKOFF_FACTOR = 2.0
+RECONNECT_JITTER = 0.2
+# First reconnection delay in seconds, capped at the reconnectInterval setting
+MIN_RECONNECT_DELAY = 1.0
+# Minimum time between two connect attempts in seconds
+MIN_CONNECT_BACKOFF = 0.5
+
+# TCP tuning for the host link: drop a stalled connection after 2 seconds so it is
+# re-established instead of freezing braille output behind kernel retransmissions
+SOCKET_OPTS = {"TCP_NODELAY": 1, "TCP_USER_TIMEOUT": 2000}
+
+# Host IP/port edits within this many seconds cause a single reconnect
+SETTING_RECONNECT_DELAY = 0.5
+
+# Explicitly saved settings changes within this many seconds are written to disk once
+SAVE_SETTINGS_DELAY = 2.0
+
+# While frames keep arriving during sends, display() calls within this many seconds
+# are sent as one frame, the last one; a frame after an idle display is sent at once
+DISPLAY_COALESCE_DELAY = 0.01
+
+# Key presses waiting for the main thread; beyond this the oldest are dropped
+KEY_QUEUE_SIZE = 256
+
+# The same announcement is not repeated within this many seconds
+SPEECH_DEDUP_INTERVAL = 2.0
+
+# Identical frames are re-sent at least this often (seconds), as a refresh of the host display
+FRAME_RESEND_INTERVAL = 5.0
+
+# Basic routing keys (cell selectors), key IDs 1-80
+_ROUTING_GESTURES = tuple(f"routing{i}" for i in range(1, 81))
+
+# Navigation keys (these would be defined based on the host braille display)
+_REMBRAILLE_KEY_MAP = {
+	100: "leftArrow",
+	101: "rightArrow",
+	102: "upArrow",
+	103: "downArrow",
+	110: "space",
+	120: "scrollLeft",
+	121: "scrollRight",
+}
 
 
 class RemBrailleDriverSetting:
@@ -40,14 +88,14 @@ class RemBrailleDriverSetting:
 		
 		@property
 		def value(self):
-			return getattr(self.driver, '_hostIP', '')
+			return self.driver._hostIP
 		
 		@value.setter
 		def value(self, val):
 			self.driver._hostIP = val
 			# Reconnect if IP changed
 			if self.driver.connected and val != self.driver.com.host_ip:
-				wx.CallAfter(self.driver._reconnect_with_new_ip, val)
+				self.driver._debounce_setting_reconnect(self.driver._reconnect_with_new_ip, val)
 	
 	class PortSetting:
 		"""Port number setting"""
@@ -59,7 +107,7 @@ class RemBrailleDriverSetting:
 		
 		@property
 		def value(self):
-			return getattr(self.driver, '_port', REMBRAILLE_PORT)
+			return self.driver._port
 		
 		@value.setter
 		def value(self, val):
@@ -69,7 +117,7 @@ class RemBrailleDriverSetting:
 					self.driver._port = port
 					# Reconnect if port changed
 					if self.driver.connected and port != self.driver.com.port:
-						wx.CallAfter(self.driver._reconnect_with_new_port, port)
+						self.driver._debounce_setting_reconnect(self.driver._reconnect_with_new_port, port)
 			except (ValueError, TypeError):
 				pass
 	
@@ -96,7 +144,7 @@ class BrailleDisplayDriver(braille.BrailleDisplayDriver):
 		),
 		NumericDriverSetting(
 			"reconnectInterval",
-			_("Reconnection &interval (minutes)"),
+			_("Maximum reconnection &interval (minutes)"),
 			defaultVal=1,
 			minVal=1,
 			maxVal=60,
@@ -121,24 +169,67 @@ class BrailleDisplayDriver(braille.BrailleDisplayDriver):
 		self.connected = False
 		self.numCells = 0
 		
+		# Reusable outgoing braille frame and the zeros used to pad it
+		self._frame = bytearray()
+		self._blank_frame = b""
+		self._last_frame: Optional[bytes] = None
+		self._last_frame_time = 0.0
+		
+		# Display sender: one persistent thread sending the latest pending frame
+		self._display_thread: Optional[threading.Thread] = None
+		self._display_cond = threading.Condition()
+		self._display_pending = False
+		self._display_stop = False
+		self._send_frame = bytearray()
+		
 		# Settings
 		self._hostIP = ""
 		self._port = REMBRAILLE_PORT
 		self.autoConnect = True
 		self.reconnectInterval = 1  # minutes
 		
+		# Announcements, translated once
+		self._msg_connected = _("RemBraille connected to {ip}:{port} with {cells} cells.")
+		self._msg_attempting = _("RemBraille attempting reconnection.")
+		self._msg_lost = _("RemBraille connection lost.")
+		self._last_spoken = ""
+		self._last_spoken_time = 0.0
+		
+		# Key presses handed from the receive thread to the main thread
+		self._key_queue: collections.deque[int] = collections.deque(maxlen=KEY_QUEUE_SIZE)
+		self._key_drain_scheduled = threading.Event()
+		
 		# Communication
 		self.com: Optional[RemBrailleCom] = None
-		self._connection_lock = threading.Lock()
+		# _state_lock guards the connection state and is only held briefly;
+		# _connect_attempt_lock serializes the (blocking) connect attempts
+		self._state_lock = threading.Lock()
+		self._connect_attempt_lock = threading.Lock()
 		
 		# Reconnection timer
-		self._reconnect_timer: Optional[threading.Timer] = None
+		# Reconnection worker: one persistent thread waiting for the scheduled attempt
+		self._reconnect_thread: Optional[threading.Thread] = None
+		self._reconnect_cond = threading.Condition()
+		self._reconnect_target: Optional[Tuple[str, int]] = None
+		self._reconnect_deadline = 0.0
+		self._reconnect_stop = False
+		self._terminated = False  # Set by terminate(); no reconnection is scheduled after it
+		self._backoff_s = 0.0  # Next reconnection delay, 0 until the first failure
+		self._last_connect_attempt = 0.0  # time.monotonic() of the last connect attempt
+		
+		# Deferred reconnect after host IP/port edits
+		self._reconnect_debounce_timer: Optional[threading.Timer] = None
+		
+		# Deferred settings save
+		self._save_timer: Optional[threading.Timer] = None
+		self._save_lock = threading.Lock()
+		self._settings_dirty = False
 		
 		# Load settings from config
 		self._load_settings()
 		
 		# Initialize communication
-		self.com = RemBrailleCom(on_key_event=self._on_key_event)
+		self.com = self._new_com()
 		
 		# Auto-connect if enabled
 		if self.autoConnect:
@@ -157,14 +248,49 @@ class BrailleDisplayDriver(braille.BrailleDisplayDriver):
 			if "remBrailleDriver" not in config.conf["braille"]:
 				config.conf["braille"]["remBrailleDriver"] = {}
 	
-	def _save_settings(self):
-		"""Save settings to NVDA configuration"""
+	def _save_settings(self, persist: bool = False):
+		"""
+		Save settings to NVDA configuration
+		
+		@param persist: Also write the configuration to disk (after a short delay,
+			coalescing bursts); otherwise only the in-memory configuration is updated
+			and the write happens on terminate or NVDA's own save
+		"""
 		try:
 			section = config.conf["braille"]["remBrailleDriver"]
 			section["hostIP"] = self._hostIP
 			section["port"] = int(self._port)
 			section["autoConnect"] = self.autoConnect
 			section["reconnectInterval"] = self.reconnectInterval
+		except Exception as e:
+			log.error(f"Failed to save RemBraille settings: {e}")
+			return
+		
+		with self._save_lock:
+			self._settings_dirty = True
+			if not persist:
+				return
+			if self._save_timer:
+				self._save_timer.cancel()
+			self._save_timer = threading.Timer(SAVE_SETTINGS_DELAY, self._write_settings)
+			self._save_timer.daemon = True
+			self._save_timer.start()
+	
+	def _flush_settings(self):
+		"""Write changed settings to disk immediately"""
+		with self._save_lock:
+			if self._save_timer:
+				self._save_timer.cancel()
+				self._save_timer = None
+			if not self._settings_dirty:
+				return
+		self._write_settings()
+	
+	def _write_settings(self):
+		"""Write the NVDA configuration to disk"""
+		with self._save_lock:
+			self._settings_dirty = False
+		try:
 			config.conf.save()
 		except Exception as e:
 			log.error(f"Failed to save RemBraille settings: {e}")
@@ -177,15 +303,15 @@ class BrailleDisplayDriver(braille.BrailleDisplayDriver):
 					# Use configured host IP
 					self._connect_to_host(self._hostIP, self._port)
 				else:
-					# Try localhost first (for debugging)
-					log.info("Attempting to connect to localhost for debugging")
-					if self._connect_to_host("127.0.0.1", self._port):
-						self._hostIP = "127.0.0.1"
-						self._save_settings()
-						return
+					# Race localhost (for debugging) and the suggested host IPs, first to answer wins
+					candidates = [ip for ip, _desc in suggest_host_ips()]
+					log.info(f"Probing RemBraille host candidates: {', '.join(candidates)}")
+					host_ip = probe_hosts(candidates, self._port)
 					
-					# Try to auto-detect host IP
-					host_ip = get_vm_host_ip()
+					# Fall back to auto-detecting the host IP (joins the detection
+					# suggest_host_ips() may have started in the background)
+					if not host_ip:
+						host_ip = get_vm_host_ip()
 					if host_ip:
 						self._hostIP = host_ip
 						self._save_settings()
@@ -202,30 +328,51 @@ class BrailleDisplayDriver(braille.BrailleDisplayDriver):
 	
 	def _connect_to_host(self, host_ip: str, port: int = REMBRAILLE_PORT) -> bool:
 		"""Connect to RemBraille host"""
-		with self._connection_lock:
-			if self.connected:
-				return True
+		with self._connect_attempt_lock:
+			with self._state_lock:
+				if self.connected:
+					return True
+				com = self.com
+				if not com or self._terminated:
+					return False
 			
-			if not self.com:
-				return False
+			# Never hammer a host that refuses instantly
+			elapsed = time.monotonic() - self._last_connect_attempt
+			if elapsed < MIN_CONNECT_BACKOFF:
+				time.sleep(MIN_CONNECT_BACKOFF - elapsed)
+			self._last_connect_attempt = time.monotonic()
 			
+			# Connect without holding the state lock, so disconnects and status queries don't wait
 			log.info(f"Connecting to RemBraille host at {host_ip}:{port}")
+			success = com.connect(host_ip, port)
+			
+			with self._state_lock:
+				# A disconnect or terminate meanwhile replaced the connection we just made
+				replaced = com is not self.com or self._terminated
+				success = success and com.is_connected() and not replaced
+				if success:
+					self.connected = True
+					self.numCells = com.get_num_cells()
+					with self._display_cond:
+						self._frame = bytearray(self.numCells)
+						self._blank_frame = bytes(self.numCells)
+					self._last_frame = None
+					self._hostIP = host_ip
+					self._port = port
+					self._backoff_s = 0.0
 			
-			if self.com.connect(host_ip, port):
-				self.connected = True
-				self.numCells = self.com.get_num_cells()
-				self._hostIP = host_ip
-				self._port = port
+			if success:
 				self._save_settings()
 				
 				# Announce connection success (use CallAfter for thread safety)
-				def announce_success():
-					speech.speakMessage(_("RemBraille connected to {ip}:{port} with {cells} cells.").format(
-						ip=host_ip, port=port, cells=self.numCells
-					))
-				wx.CallAfter(announce_success)
+				wx.CallAfter(self._speak, self._msg_connected.format(
+					ip=host_ip, port=port, cells=self.numCells
+				))
 				
 				return True
+			elif replaced:
+				com.disconnect()
+				return False
 			else:
 				log.error(f"Failed to connect to RemBraille host at {host_ip}:{port}")
 				# Start reconnection timer
@@ -234,78 +381,186 @@ class BrailleDisplayDriver(braille.BrailleDisplayDriver):
 	
 	def _disconnect_from_host(self):
 		"""Disconnect from RemBraille host"""
-		with self._connection_lock:
-			# Cancel reconnection timer if running
-			self._cancel_reconnection_timer()
+		with self._state_lock:
+			# Cancel scheduled reconnection, if any
+			self._cancel_reconnection()
 			
-			if self.com:
-				self.com.disconnect()
+			# Swap in a fresh connection; the old one is closed after releasing the lock,
+			# since closing joins its receive thread, which may be waiting for the lock
+			com = self.com
+			if com:
+				self.com = None if self._terminated else self._new_com()
 			self.connected = False
 			self.numCells = 0
+			self._last_frame = None
+			with self._display_cond:
+				self._display_pending = False
+		
+		if com:
+			# An intended disconnect is not a lost connection
+			com.on_connection_lost = None
+			com.disconnect()
 	
 	def _reconnect_with_new_ip(self, new_ip: str):
 		"""Reconnect with new IP address"""
 		self._disconnect_from_host()
-		time.sleep(1.0)  # Brief delay
 		self._connect_to_host(new_ip, self._port)
 	
 	def _reconnect_with_new_port(self, new_port: int):
 		"""Reconnect with new port"""
 		self._disconnect_from_host()
-		time.sleep(1.0)  # Brief delay
 		self._connect_to_host(self._hostIP, new_port)
 	
+	def _debounce_setting_reconnect(self, reconnect: Callable[[Any], None], value: Any):
+		"""Reconnect with an edited setting once the edits have settled"""
+		if self._reconnect_debounce_timer:
+			self._reconnect_debounce_timer.cancel()
+		self._reconnect_debounce_timer = threading.Timer(SETTING_RECONNECT_DELAY, wx.CallAfter, [reconnect, value])
+		self._reconnect_debounce_timer.daemon = True
+		self._reconnect_debounce_timer.start()
+	
+	def _new_com(self) -> RemBrailleCom:
+		"""Create an unconnected communication object for this driver"""
+		# The driver schedules reconnections itself, with backoff and announcements
+		com = RemBrailleCom(
+			on_key_event=self._on_key_event,
+			socket_opts=SOCKET_OPTS,
+			auto_reconnect=False
+		)
+		com.on_connection_lost = lambda: self._handle_connection_lost(com)
+		return com
+	
 	def _on_key_event(self, key_id: int, is_pressed: bool):
-		"""Handle key events from braille display"""
-		try:
-			if is_pressed:
+		"""Handle key events from braille display (called on the receive thread)"""
+		if not is_pressed:
+			return
+		
+		# Queue the key and return to the socket; gestures are emulated on the main thread
+		self._key_queue.append(key_id)
+		if not self._key_drain_scheduled.is_set():
+			self._key_drain_scheduled.set()
+			wx.CallAfter(self._drain_keys)
+	
+	def _drain_keys(self):
+		"""Emulate the gestures of all queued key presses"""
+		# Clear first: a key queued while draining schedules another drain
+		self._key_drain_scheduled.clear()
+		while self._key_queue:
+			key_id = self._key_queue.popleft()
+			try:
 				# Map RemBraille key IDs to NVDA input gestures
 				gesture_name = self._map_key_to_gesture(key_id)
 				if gesture_name:
 					inputCore.manager.emulateGesture(RemBrailleInputGesture(gesture_name))
-		except Exception as e:
-			log.error(f"Error handling key event {key_id}: {e}")
+			except Exception as e:
+				log.error(f"Error handling key event {key_id}: {e}")
 	
 	def _schedule_reconnection(self, host_ip: str, port: int, reason: str):
-		"""Schedule automatic reconnection after configured interval"""
-		# Cancel existing timer
-		self._cancel_reconnection_timer()
+		"""
+		Schedule automatic reconnection with jittered exponential backoff
 		
-		# Announce connection loss and retry schedule
-		speech.speakMessage(_("RemBraille {reason}. Will retry in {minutes} minutes.").format(
-			reason=reason.lower(), minutes=self.reconnectInterval
-		))
+		The delay starts at MIN_RECONNECT_DELAY seconds and doubles per failed
+		attempt up to reconnectInterval minutes, so short outages recover quickly
+		while a dead host is retried rarely. The driver is the only one
+		reconnecting; its connections do not reconnect on their own.
+		"""
+		if self._terminated:
+			return
 		
-		# Schedule reconnection
-		delay_seconds = self.reconnectInterval * 60
-		self._reconnect_timer = threading.Timer(delay_seconds, self._attempt_reconnection, [host_ip, port])
-		self._reconnect_timer.start()
+		max_delay = self.reconnectInterval * 60
+		self._backoff_s = min(max_delay, max(MIN_RECONNECT_DELAY, self._backoff_s))
+		delay_seconds = self._backoff_s * random.uniform(1 - RECONNECT_JITTER, 1 + RECONNECT_JITTER)
+		self._backoff_s *= RECONNECT_BACKOFF_FACTOR
 		
-		log.info(f"Scheduled RemBraille reconnection to {host_ip}:{port} in {self.reconnectInterval} minutes")
+		# Announce connection loss and retry schedule
+		seconds = max(1, round(delay_seconds))
+		self._speak(ngettext(
+			"RemBraille {reason}. Will retry in {seconds} second.",
+			"RemBraille {reason}. Will retry in {seconds} seconds.",
+			seconds
+		).format(reason=reason.lower(), seconds=seconds))
+		
+		# Schedule reconnection, replacing any attempt already scheduled
+		with self._reconnect_cond:
+			if self._terminated:
+				return
+			self._reconnect_target = (host_ip, port)
+			self._reconnect_deadline = time.monotonic() + delay_seconds
+			if not self._reconnect_thread or not self._reconnect_thread.is_alive():
+				self._reconnect_stop = False
+				self._reconnect_thread = threading.Thread(
+					target=self._reconnect_worker,
+					name="RemBrailleDriverReconnect",
+					daemon=True
+				)
+				self._reconnect_thread.start()
+			self._reconnect_cond.notify()
+		
+		log.info(f"Scheduled RemBraille reconnection to {host_ip}:{port} in {delay_seconds:.1f} seconds")
+	
+	def _cancel_reconnection(self):
+		"""Cancel the scheduled reconnection, if any"""
+		with self._reconnect_cond:
+			self._reconnect_target = None
+			self._reconnect_cond.notify()
+	
+	def _stop_reconnect_worker(self):
+		"""Stop the reconnection worker thread"""
+		with self._reconnect_cond:
+			self._reconnect_target = None
+			self._reconnect_stop = True
+			self._reconnect_cond.notify()
+		
+		thread = self._reconnect_thread
+		if thread and thread is not threading.current_thread():
+			thread.join(timeout=2.0)
+		self._reconnect_thread = None
 	
-	def _cancel_reconnection_timer(self):
-		"""Cancel the reconnection timer if it's running"""
-		if self._reconnect_timer:
-			self._reconnect_timer.cancel()
-			self._reconnect_timer = None
+	def _reconnect_worker(self):
+		"""Wait for scheduled reconnections and run them"""
+		while True:
+			with self._reconnect_cond:
+				while not self._reconnect_stop:
+					if self._reconnect_target is None:
+						self._reconnect_cond.wait()
+						continue
+					remaining = self._reconnect_deadline - time.monotonic()
+					if remaining <= 0:
+						break
+					self._reconnect_cond.wait(remaining)
+				if self._reconnect_stop:
+					return
+				host_ip, port = self._reconnect_target
+				self._reconnect_target = None
+			
+			try:
+				self._attempt_reconnection(host_ip, port)
+			except Exception as e:
+				log.error(f"Error in RemBraille reconnection: {e}")
 	
 	def _attempt_reconnection(self, host_ip: str, port: int):
 		"""Attempt to reconnect to the host"""
 		log.info(f"Attempting RemBraille reconnection to {host_ip}:{port}")
-		speech.speakMessage(_("RemBraille attempting reconnection."))
+		self._speak(self._msg_attempting)
 		
-		success = self._connect_to_host(host_ip, port)
-		if not success:
-			# If connection failed, schedule another retry
-			self._schedule_reconnection(host_ip, port, "Reconnection failed")
+		# A failed connect schedules the next retry itself
+		self._connect_to_host(host_ip, port)
 	
-	def _handle_connection_lost(self):
-		"""Handle when connection is lost during operation"""
-		if self.connected:
+	def _handle_connection_lost(self, com: RemBrailleCom):
+		"""
+		Handle when connection is lost during operation (called on any thread)
+		
+		@param com: Connection that was lost; ignored if it is no longer the driver's
+		"""
+		with self._state_lock:
+			if com is not self.com:
+				return
+			was_connected = self.connected
 			self.connected = False
 			self.numCells = 0
-			
-			speech.speakMessage(_("RemBraille connection lost."))
+		
+		if was_connected:
+			self._speak(self._msg_lost)
 			log.warning("RemBraille connection lost")
 			
 			# Schedule reconnection if we have connection details
@@ -314,22 +569,18 @@ class BrailleDisplayDriver(braille.BrailleDisplayDriver):
 
 	def _map_key_to_gesture(self, key_id: int) -> Optional[str]:
 		"""Map RemBraille key ID to NVDA gesture name"""
-		# Basic routing keys (cell selectors)
-		if 1 <= key_id <= 80:  # Assuming max 80 cells
-			return f"routing{key_id}"
-		
-		# Navigation keys (these would be defined based on the host braille display)
-		key_map = {
-			100: "leftArrow",
-			101: "rightArrow", 
-			102: "upArrow",
-			103: "downArrow",
-			110: "space",
-			120: "scrollLeft",
-			121: "scrollRight",
-		}
-		
-		return key_map.get(key_id)
+		if 1 <= key_id <= len(_ROUTING_GESTURES):
+			return _ROUTING_GESTURES[key_id - 1]
+		return _REMBRAILLE_KEY_MAP.get(key_id)
+	
+	def _speak(self, message: str):
+		"""Announce a message, unless it was just announced (flapping connections)"""
+		now = time.monotonic()
+		if message == self._last_spoken and now - self._last_spoken_time < SPEECH_DEDUP_INTERVAL:
+			return
+		self._last_spoken = message
+		self._last_spoken_time = now
+		speech.speakMessage(message)
 	
 	def _show_connection_dialog(self, auto_connect: bool = False):
 		"""Show connection configuration dialog"""
@@ -344,30 +595,109 @@ class BrailleDisplayDriver(braille.BrailleDisplayDriver):
 				speech.speakMessage(_("Could not auto-detect RemBraille host. Please configure the connection manually in NVDA Settings."))
 	
 	def display(self, cells: List[int]):
-		"""Display braille cells"""
+		"""Display braille cells (sent shortly after by the display sender thread)"""
 		if not self.connected or not self.com:
 			return
 		
+		with self._display_cond:
+			# Copy into the reusable frame, truncated to the display size and padded with spaces
+			frame = self._frame
+			size = len(frame)
+			count = len(cells)
+			if count >= size:
+				frame[:] = cells[:size] if count > size else cells
+			else:
+				frame[:count] = cells
+				frame[count:] = self._blank_frame[count:]
+			
+			self._display_pending = True
+			if not self._display_thread or not self._display_thread.is_alive():
+				self._display_stop = False
+				self._display_thread = threading.Thread(
+					target=self._display_worker,
+					name="RemBrailleDisplay",
+					daemon=True
+				)
+				self._display_thread.start()
+			self._display_cond.notify()
+	
+	def _display_worker(self):
+		"""Send pending frames, coalescing bursts of display() calls into one send"""
+		in_burst = False
+		while True:
+			with self._display_cond:
+				while not self._display_pending and not self._display_stop:
+					self._display_cond.wait()
+				if self._display_stop:
+					return
+			
+			if in_burst:
+				# Trailing edge: frames arriving meanwhile replace the pending one
+				time.sleep(DISPLAY_COALESCE_DELAY)
+			
+			with self._display_cond:
+				if self._display_stop:
+					return
+				if not self._display_pending:
+					continue
+				self._display_pending = False
+				self._send_frame[:] = self._frame
+			
+			self._send_display_frame(self._send_frame)
+			
+			with self._display_cond:
+				# A frame arriving during the send means a burst is going on
+				in_burst = self._display_pending
+	
+	def _stop_display_worker(self):
+		"""Stop the display sender thread"""
+		with self._display_cond:
+			self._display_pending = False
+			self._display_stop = True
+			self._display_cond.notify()
+		
+		thread = self._display_thread
+		if thread and thread is not threading.current_thread():
+			thread.join(timeout=2.0)
+		self._display_thread = None
+	
+	def _send_display_frame(self, frame: bytearray):
+		"""Send one frame to the host"""
+		com = self.com
+		if not self.connected or not com:
+			return
+		
 		try:
-			# Ensure we don't send more cells than the display supports
-			if len(cells) > self.numCells:
-				cells = cells[:self.numCells]
-			elif len(cells) < self.numCells:
-				# Pad with spaces
-				cells = cells + [0] * (self.numCells - len(cells))
+			# Skip frames identical to the last one sent, unless it is time for a refresh
+			now = time.monotonic()
+			if frame == self._last_frame and now - self._last_frame_time < FRAME_RESEND_INTERVAL:
+				return
 			
-			success = self.com.display_cells(cells)
-			if not success:
+			if com.display_cells(frame):
+				self._last_frame = bytes(frame)
+				self._last_frame_time = now
+			else:
 				# Connection may have been lost
-				self._handle_connection_lost()
+				self._handle_connection_lost(com)
 		except Exception as e:
 			log.error(f"Error displaying braille cells: {e}")
 			# Assume connection loss
-			self._handle_connection_lost()
+			self._handle_connection_lost(com)
 	
 	def terminate(self):
 		"""Clean up and disconnect"""
+		# Don't let a running host detection hold up shutdown
+		cancel_detection()
+		with self._reconnect_cond:
+			self._terminated = True
+		# A host IP/port edit must not reconnect the terminated driver
+		if self._reconnect_debounce_timer:
+			self._reconnect_debounce_timer.cancel()
+			self._reconnect_debounce_timer = None
+		self._stop_reconnect_worker()
+		self._stop_display_worker()
 		self._disconnect_from_host()
+		self._flush_settings()
 		super().terminate()
 	
 	@classmethod
@@ -388,13 +718,37 @@ class RemBrailleInputGesture(inputCore.InputGesture):
 		return "remBrailleDriver"
 
 
+def _do_test(test_com: RemBrailleCom, ip: str, port: int) -> Tuple[bool, int]:
+	"""
+	Connect to a host once to check it, then disconnect
+	
+	@return: (success, number of cells)
+	"""
+	try:
+		if not test_com.connect(ip, port):
+			return False, 0
+		return True, test_com.get_num_cells()
+	finally:
+		test_com.disconnect()
+
+
 class RemBrailleConnectionDialog(wx.Dialog):
 	"""Connection configuration dialog for RemBraille"""
 	
+	# Connection tests run here so the dialog stays responsive
+	_TEST_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="RemBrailleTest")
+	TEST_POLL_INTERVAL_MS = 100
+	
 	def __init__(self, parent, driver: BrailleDisplayDriver, auto_connect: bool = False):
 		self.driver = driver
 		self.auto_connect = auto_connect
 		
+		# Running connection test
+		self._test_com: Optional[RemBrailleCom] = None
+		self._test_future: Optional[Future[Tuple[bool, int]]] = None
+		self._test_progress: Optional[wx.ProgressDialog] = None
+		self._test_timer: Optional[wx.Timer] = None
+		
 		title = _("RemBraille Connection") if not auto_connect else _("RemBraille Auto-Connect Failed")
 		super().__init__(parent, title=title, style=wx.DEFAULT_DIALOG_STYLE | wx.RESIZE_BORDER)
 		
@@ -465,6 +819,7 @@ class RemBrailleConnectionDialog(wx.Dialog):
 		# Bind events
 		self.test_btn.Bind(wx.EVT_BUTTON, self._on_test)
 		self.connect_btn.Bind(wx.EVT_BUTTON, self._on_connect)
+		self.Bind(wx.EVT_WINDOW_DESTROY, self._on_destroy)
 		
 		self.SetSizer(main_sizer)
 		self.Fit()
@@ -490,43 +845,85 @@ class RemBrailleConnectionDialog(wx.Dialog):
 			gui.messageBox(_("Please enter a host IP address."), _("Error"), wx.OK | wx.ICON_ERROR)
 			return
 		
-		# Show testing message
-		progress = gui.IndeterminateProgressDialog(
-			self,
+		# Show testing message, with a Cancel button
+		self._test_progress = wx.ProgressDialog(
 			_("RemBraille Connection Test"),
-			_("Testing connection to {ip}:{port}...").format(ip=ip, port=port)
+			_("Testing connection to {ip}:{port}...").format(ip=ip, port=port),
+			parent=self,
+			style=wx.PD_APP_MODAL | wx.PD_CAN_ABORT
 		)
+		self.test_btn.Disable()
+		
+		# Test connection in background thread, polled from a timer
+		self._test_com = RemBrailleCom()
+		self._test_future = self._TEST_EXECUTOR.submit(_do_test, self._test_com, ip, port)
+		self._test_timer = wx.Timer(self)
+		self.Bind(wx.EVT_TIMER, self._on_test_poll, self._test_timer)
+		self._test_timer.Start(self.TEST_POLL_INTERVAL_MS)
+	
+	def _on_test_poll(self, event):
+		"""Check on the running connection test"""
+		future = self._test_future
+		if not future:
+			return
 		
+		if not future.done():
+			keep_going, _skip = self._test_progress.Pulse()
+			if not keep_going:
+				self._cancel_test()
+			return
+		
+		self._finish_test()
 		try:
-			# Test connection in background thread
-			test_com = RemBrailleCom()
-			success = test_com.connect(ip, port)
-			
-			if success:
-				cells = test_com.get_num_cells()
-				test_com.disconnect()
-				progress.done()
-				
-				gui.messageBox(
-					_("Connection successful! Found {cells} braille cells.").format(cells=cells),
-					_("Test Successful"),
-					wx.OK | wx.ICON_INFORMATION
-				)
-			else:
-				progress.done()
-				gui.messageBox(
-					_("Connection failed. Please check the IP address and ensure the RemBraille host server is running."),
-					_("Test Failed"),
-					wx.OK | wx.ICON_ERROR
-				)
+			success, cells = future.result()
 		except Exception as e:
-			progress.done()
 			log.error(f"Connection test error: {e}")
 			gui.messageBox(
 				_("Connection test failed: {error}").format(error=str(e)),
 				_("Test Error"),
 				wx.OK | wx.ICON_ERROR
 			)
+			return
+		
+		if success:
+			gui.messageBox(
+				_("Connection successful! Found {cells} braille cells.").format(cells=cells),
+				_("Test Successful"),
+				wx.OK | wx.ICON_INFORMATION
+			)
+		else:
+			gui.messageBox(
+				_("Connection failed. Please check the IP address and ensure the RemBraille host server is running."),
+				_("Test Failed"),
+				wx.OK | wx.ICON_ERROR
+			)
+	
+	def _cancel_test(self):
+		"""Abort the running connection test"""
+		future, test_com = self._test_future, self._test_com
+		self._finish_test()
+		if future and not future.cancel() and test_com:
+			# Already running: closing the socket makes the pending connect fail
+			test_com.disconnect()
+	
+	def _finish_test(self):
+		"""Stop polling and close the progress dialog"""
+		if self._test_timer:
+			self._test_timer.Stop()
+			self._test_timer = None
+		if self._test_progress:
+			self._test_progress.Destroy()
+			self._test_progress = None
+		self._test_future = None
+		self._test_com = None
+		if self.test_btn:
+			self.test_btn.Enable()
+	
+	def _on_destroy(self, event):
+		"""Abort a running connection test when the dialog goes away"""
+		event.Skip()
+		if event.GetEventObject() is self and self._test_future:
+			self._cancel_test()
 	
 	def _on_connect(self, event):
 		"""Connect to the selected host"""
@@ -542,7 +939,7 @@ class RemBrailleConnectionDialog(wx.Dialog):
 		self.driver._hostIP = ip
 		self.driver._port = port
 		self.driver.autoConnect = auto_connect
-		self.driver._save_settings()
+		self.driver._save_settings(persist=True)
 		
 		# Show connecting message
 		progress = gui.IndeterminateProgressDialog(
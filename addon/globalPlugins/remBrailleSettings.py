@@ -60,8 +60,8 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 			)
 			gui.mainFrame.sysTrayIcon.Bind(wx.EVT_MENU, self._on_reconnect, self.reconnect_item)
 			
-			# Add submenu to Tools
-			tools_menu.AppendSubMenu(self.rembraille_menu, _("RemBraille"))
+			# Add submenu to Tools, keeping the item so terminate() can remove it directly
+			self._submenu_item = tools_menu.AppendSubMenu(self.rembraille_menu, _("RemBraille"))
 			
 		except Exception as e:
 			log.error(f"Failed to add RemBraille menu items: {e}")
@@ -170,14 +170,13 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		"""Clean up when plugin is terminated"""
 		try:
 			# Remove menu items
-			if hasattr(self, 'rembraille_menu'):
-				tools_menu = gui.mainFrame.sysTrayIcon.toolsMenu
-				# Find and remove our submenu
-				for i in range(tools_menu.GetMenuItemCount()):
-					item = tools_menu.FindItemByPosition(i)
-					if item and item.GetItemLabel() == _("RemBraille"):
-						tools_menu.Delete(item.GetId())
-						break
+			if hasattr(self, '_submenu_item'):
+				sys_tray_icon = gui.mainFrame.sysTrayIcon
+				# Drop the handlers so wx no longer references this plugin
+				for item in (self.connection_item, self.status_item, self.reconnect_item):
+					sys_tray_icon.Unbind(wx.EVT_MENU, source=item)
+				sys_tray_icon.toolsMenu.DestroyItem(self._submenu_item)
+				del self._submenu_item
 		except Exception as e:
 			log.debug(f"Error during RemBraille plugin termination: {e}")
 		
@@ -7,12 +7,18 @@ This server simulates a braille display host and displays all messages
 received from the RemBraille NVDA driver. Useful for testing and debugging.
 
 Usage:
-    python rembraille_server.py [--port PORT] [--cells CELLS] [--verbose]
+    python rembraille_server.py [--port PORT] [--cells CELLS] [--verbose] [--threaded | --io-uring]
 
 Copyright (C) 2025 Stefan Lohmaier
 Licensed under GNU GPL v2
 """
 
+import asyncio
+import codecs
+import collections
+import concurrent.futures
+import select
+import selectors
 import socket
 import struct
 import threading
@@ -22,9 +28,20 @@ import sys
 import signal
 import os
 import platform
-import re
-from typing import Optional, Dict, Any, List
-from datetime import datetime
+import queue
+from typing import Optional, Dict, List, Tuple, Union
+
+# uvloop is optional; the standard asyncio event loop is used without it
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# liburing is optional and Linux-only; it enables the --io-uring backend
+try:
+    import liburing
+except ImportError:
+    liburing = None
 
 
 # Terminal control functions
@@ -35,6 +52,9 @@ def clear_screen():
     else:
         os.system('clear')
 
+# The live monitor is redrawn in place with ANSI escapes; Windows consoles need cls
+_ANSI_REDRAW = platform.system() != 'Windows'
+
 def move_cursor(row: int, col: int):
     """Move cursor to specific position"""
     if platform.system() != 'Windows':
@@ -42,50 +62,124 @@ def move_cursor(row: int, col: int):
     # Windows doesn't support ANSI escape codes well without special setup
 
 # Unicode fallback for terminals that don't support UTF-8
+# Emoji map to ASCII tags; the emoji variation selector (U+FE0F) is dropped and
+# braille cells (U+2800-U+28FF) become dots, with the blank cell as a space
+_ASCII_FALLBACK = str.maketrans({
+    "🚀": "[START]",
+    "📡": "[LISTEN]",
+    "📄": "[CELLS]",
+    "🔧": "[MODE]",
+    "⏰": "[TIME]",
+    "🔌": "[CLIENT]",
+    "❌": "[ERROR]",
+    "✅": "[OK]",
+    "⚠": "[WARN]",
+    "🛑": "[STOP]",
+    "📨": "[MSG]",
+    "🤝": "[HANDSHAKE]",
+    "📏": "[SIZE]",
+    "🔤": "[BRAILLE]",
+    "📝": "[TEXT]",
+    "🔢": "[HEX]",
+    "🏓": "[PING]",
+    "⌨": "[KEY]",
+    "❓": "[UNKNOWN]",
+    "📊": "[STATS]",
+    "⏱": "[UPTIME]",
+    "👥": "[CLIENTS]",
+    "💡": "[INFO]",
+    "\ufe0f": None,
+    "\u2800": " ",
+    **{chr(0x2800 + cell): "." for cell in range(1, 256)},
+})
+
+# Output is encoded once and written straight to the stdout fd, bypassing the
+# TextIOWrapper lock. Windows consoles (and a stdout without a real fd) keep print.
+def _stdout_fd() -> Optional[int]:
+    """The stdout file descriptor to write log output to, or None to use print"""
+    if sys.platform == 'win32':
+        return None
+    try:
+        return sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+def _stdout_is_unicode(encoding: str) -> bool:
+    """Whether text in this encoding can carry emoji and braille as-is"""
+    try:
+        return codecs.lookup(encoding).name.startswith('utf')
+    except LookupError:
+        return False
+
+_STDOUT_FD = _stdout_fd()
+_STDOUT_ENCODING = getattr(sys.stdout, 'encoding', None) or 'utf-8'
+# Decided once: non-Unicode terminals always get the ASCII fallback
+_STDOUT_UNICODE = _stdout_is_unicode(_STDOUT_ENCODING)
+
 def safe_print(text: str, end='\n'):
     """Print text with fallback for non-UTF-8 terminals"""
-    try:
-        print(text, end=end)
-    except UnicodeEncodeError:
-        # Replace Unicode characters with ASCII alternatives
-        safe_text = text.replace("🚀", "[START]")
-        safe_text = safe_text.replace("📡", "[LISTEN]")
-        safe_text = safe_text.replace("📄", "[CELLS]")
-        safe_text = safe_text.replace("🔧", "[MODE]")
-        safe_text = safe_text.replace("⏰", "[TIME]")
-        safe_text = safe_text.replace("🔌", "[CLIENT]")
-        safe_text = safe_text.replace("❌", "[ERROR]")
-        safe_text = safe_text.replace("✅", "[OK]")
-        safe_text = safe_text.replace("⚠️", "[WARN]")
-        safe_text = safe_text.replace("🛑", "[STOP]")
-        safe_text = safe_text.replace("📨", "[MSG]")
-        safe_text = safe_text.replace("🤝", "[HANDSHAKE]")
-        safe_text = safe_text.replace("📏", "[SIZE]")
-        safe_text = safe_text.replace("🔤", "[BRAILLE]")
-        safe_text = safe_text.replace("📝", "[TEXT]")
-        safe_text = safe_text.replace("🔢", "[HEX]")
-        safe_text = safe_text.replace("🏓", "[PING]")
-        safe_text = safe_text.replace("⌨️", "[KEY]")
-        safe_text = safe_text.replace("❓", "[UNKNOWN]")
-        safe_text = safe_text.replace("📊", "[STATS]")
-        safe_text = safe_text.replace("⏱️", "[UPTIME]")
-        safe_text = safe_text.replace("👥", "[CLIENTS]")
-        safe_text = safe_text.replace("💡", "[INFO]")
-        safe_text = safe_text.replace("⠀", " ")  # Braille space
-        # Replace all braille Unicode characters (U+2800-U+28FF) with dots or spaces
-        safe_text = re.sub(r'[\u2800-\u28FF]', '.', safe_text)
-        print(safe_text, end=end)
+    if _STDOUT_FD is None:
+        try:
+            print(text, end=end)
+        except UnicodeEncodeError:
+            # Replace Unicode characters with ASCII alternatives in a single pass
+            sys.stdout.write(text.translate(_ASCII_FALLBACK) + end)
+        return
+    
+    line = text + end
+    if not _STDOUT_UNICODE:
+        line = line.translate(_ASCII_FALLBACK)
+    data = line.encode(_STDOUT_ENCODING, errors='replace')
+    view = memoryview(data)
+    while view:
+        view = view[os.write(_STDOUT_FD, view):]
+
+
+# Most log lines share their second with the previous one; format each second once.
+# (second, text) is swapped as one tuple so concurrent readers never see a mix.
+_last_timestamp = (-1, "")
+
+def format_timestamp(when: float) -> str:
+    """Format a time.time() value as HH:MM:SS, caching the last second"""
+    global _last_timestamp
+    sec = int(when)
+    cached_sec, text = _last_timestamp
+    if sec != cached_sec:
+        text = time.strftime("%H:%M:%S", time.localtime(sec))
+        _last_timestamp = (sec, text)
+    return text
 
 
 # Protocol constants (matching the client)
 REMBRAILLE_PORT = 17635
 PROTOCOL_VERSION = 1
 TIMEOUT = 30.0
+MAX_MESSAGE_SIZE = 4 + 0xFFFF  # Header plus the largest 16-bit payload
+SOCKET_BUFFER_SIZE = 64 * 1024  # Minimum SO_RCVBUF / SO_SNDBUF for client sockets
+MAX_CLIENT_THREADS = 64  # Threaded mode: clients beyond this wait for a free worker
+DISPLAY_REFRESH_INTERVAL = 1.0  # Live monitor redraw period, driven by main()'s command loop
+DISPLAY_LOG_INTERVAL = 0.5  # Without --verbose, log at most one display update per interval
+
+# Received payloads: bytes from asyncio streams, memoryview over the threaded receive buffer
+Payload = Union[bytes, memoryview]
+
+# io_uring backend: ring size, receive chunk size and user_data operation tags
+URING_ENTRIES = 256
+URING_RECV_SIZE = 64 * 1024
+_URING_ACCEPT, _URING_RECV, _URING_SEND = range(3)
+
+# Scatter-gather sends are not available on Windows sockets
+_HAS_SENDMSG = hasattr(socket.socket, "sendmsg")
+# Per-call non-blocking sends (not available on Windows)
+_SEND_FLAGS = getattr(socket, "MSG_DONTWAIT", 0)
+# Longest a broadcast waits for a client's reply in progress before skipping that client (seconds)
+_BROADCAST_LOCK_TIMEOUT = 0.05
 
 # Message types
 MSG_HANDSHAKE = 0x01
 MSG_HANDSHAKE_RESP = 0x02
 MSG_DISPLAY_CELLS = 0x10
+MSG_DISPLAY_CELLS_DELTA = 0x11
 MSG_KEY_EVENT = 0x20
 MSG_NUM_CELLS_REQ = 0x30
 MSG_NUM_CELLS_RESP = 0x31
@@ -93,6 +187,21 @@ MSG_PING = 0x40
 MSG_PONG = 0x41
 MSG_ERROR = 0xFF
 
+# Precompiled wire formats
+_HEADER = struct.Struct("!BBH")       # version, type, payload length
+_CELL_COUNT = struct.Struct("!H")     # num-cells response / delta change count
+_CELL_CHANGE = struct.Struct("!HB")   # delta entry: cell index, value
+_KEY_EVENT = struct.Struct("!HB")     # key id, event type
+
+# Complete frames for the body-less control messages
+_EMPTY_FRAMES = {
+    msg_type: _HEADER.pack(PROTOCOL_VERSION, msg_type, 0)
+    for msg_type in (MSG_PING, MSG_PONG, MSG_NUM_CELLS_REQ)
+}
+
+# Cell value -> display character lookup table (blank cells show as a space)
+_ASCII_TABLE = bytes(32 if cell == 0 else cell if 32 <= cell < 127 else ord("?") for cell in range(256))
+
 # Key event types
 KEY_DOWN = 0x01
 KEY_UP = 0x02
@@ -102,6 +211,7 @@ MSG_NAMES = {
     MSG_HANDSHAKE: "HANDSHAKE",
     MSG_HANDSHAKE_RESP: "HANDSHAKE_RESP",
     MSG_DISPLAY_CELLS: "DISPLAY_CELLS",
+    MSG_DISPLAY_CELLS_DELTA: "DISPLAY_CELLS_DELTA",
     MSG_KEY_EVENT: "KEY_EVENT",
     MSG_NUM_CELLS_REQ: "NUM_CELLS_REQ",
     MSG_NUM_CELLS_RESP: "NUM_CELLS_RESP",
@@ -112,7 +222,9 @@ MSG_NAMES = {
 
 
 class RemBrailleMessage:
-    """Represents a RemBraille protocol message"""
+    """Represents a RemBraille protocol message (used for sending only)"""
+    
+    __slots__ = ('msg_type', 'data', 'length')
     
     def __init__(self, msg_type: int, data: bytes = b""):
         self.msg_type = msg_type
@@ -121,8 +233,34 @@ class RemBrailleMessage:
     
     def serialize(self) -> bytes:
         """Serialize message to bytes for transmission"""
-        header = struct.pack("!BBH", PROTOCOL_VERSION, self.msg_type, self.length)
-        return header + self.data
+        if not self.length:
+            return _EMPTY_FRAMES.get(self.msg_type) or self.header()
+        return self.header() + self.data
+    
+    def header(self) -> bytes:
+        """Serialize only the 4-byte message header"""
+        return _HEADER.pack(PROTOCOL_VERSION, self.msg_type, self.length)
+    
+    def send_into(self, sock: socket.socket, send_buf: Optional[bytearray] = None):
+        """Send message on sock without concatenating header and payload"""
+        total = 4 + self.length
+        if _HAS_SENDMSG and self.length:
+            # Gather-write header and payload in one syscall
+            header = self.header()
+            sent = sock.sendmsg([header, self.data])
+            if sent < total:
+                # Finish the frame from the two buffers, still without joining them
+                if sent < 4:
+                    sock.sendall(header[sent:])
+                    sent = 4
+                sock.sendall(memoryview(self.data)[sent - 4:])
+        elif send_buf is not None and total <= len(send_buf):
+            # Pack into the caller's reusable send buffer
+            _HEADER.pack_into(send_buf, 0, PROTOCOL_VERSION, self.msg_type, self.length)
+            send_buf[4:total] = self.data
+            sock.sendall(memoryview(send_buf)[:total])
+        else:
+            sock.sendall(self.serialize())
     
     @classmethod
     def deserialize(cls, data: bytes) -> Optional["RemBrailleMessage"]:
@@ -130,183 +268,641 @@ class RemBrailleMessage:
         if len(data) < 4:
             return None
         
-        version, msg_type, length = struct.unpack("!BBH", data[:4])
+        version, msg_type, length = _HEADER.unpack_from(data, 0)
         if version != PROTOCOL_VERSION:
-            safe_print(f"❌ Unsupported protocol version: {version}")
+            safe_print(f"[RX] Unsupported protocol version: {version}")
             return None
         
         if len(data) < 4 + length:
             return None
         
-        msg_data = data[4:4 + length]
+        msg_data = data[4:4 + length] if length else b""
         return cls(msg_type, msg_data)
 
 
+class ClientState:
+    """Per-connection state shared by the receive loop and message handlers"""
+    
+    __slots__ = ('sock', 'writer', 'address', 'client_id', 'connected_at', 'last_activity',
+                 'messages', 'recv_buf', 'recv_view', 'recv_start', 'recv_end', 'send_lock')
+    
+    def __init__(self, address: tuple, sock: Optional[socket.socket] = None,
+                 writer: Optional[asyncio.StreamWriter] = None):
+        self.sock = sock
+        self.writer = writer
+        self.address = address
+        self.client_id = f"{address[0]}:{address[1]}"
+        self.connected_at = time.monotonic()
+        self.last_activity = self.connected_at
+        self.messages = 0  # Only touched by the connection's own receive loop
+        # Only the threaded receive loop reads into these
+        self.recv_buf: Optional[bytearray] = None
+        self.recv_view: Optional[memoryview] = None
+        self.recv_start = 0  # Unparsed data is recv_buf[recv_start:recv_end]
+        self.recv_end = 0
+        # Held by every thread writing to sock, so frames never interleave (threaded mode)
+        self.send_lock = threading.Lock()
+
+
+class UringClientState(ClientState):
+    """ClientState plus the io_uring loop's per-connection bookkeeping"""
+    
+    __slots__ = ('conn_id', 'pending', 'outbox', 'sending', 'inflight', 'closing')
+    
+    def __init__(self, address: tuple, sock: socket.socket, conn_id: int):
+        super().__init__(address, sock=sock)
+        self.conn_id = conn_id
+        self.recv_buf = bytearray(URING_RECV_SIZE)
+        self.pending = bytearray()  # Partial message carried over between receives
+        self.outbox: collections.deque = collections.deque()  # Frames queued behind the in-flight send
+        self.sending: Optional[bytes] = None  # Frame of the in-flight send
+        self.inflight = 0  # Submitted operations that still reference this state's buffers
+        self.closing = False
+
+
+class UringLoop:
+    """Single-threaded accept/recv/send loop driven by io_uring completions
+    
+    Operations are tagged with (conn_id << 2 | op) so completions arriving after a
+    connection closed (and its fd was reused) are recognised and dropped. A state is
+    only forgotten once no submitted operation references its buffers any more.
+    """
+    
+    def __init__(self, server: "RemBrailleServer", listen_sock: socket.socket):
+        self.server = server
+        self.listen_sock = listen_sock
+        self.ring = liburing.Ring()
+        self.cqe = liburing.Cqe()
+        self.conns: Dict[int, UringClientState] = {}
+        self.next_conn_id = 1
+        
+        # Other threads hand frames over through posted + a wake-up byte
+        self.posted: collections.deque = collections.deque()
+        self.wake_recv, self.wake_send = socket.socketpair()
+        self.wake_recv.setblocking(False)
+        
+        self.ring_ready = False  # The ring is set up and must be exited by close()
+        self.finished = threading.Event()  # Set when run() returns
+    
+    def run(self):
+        """Process completions until the server stops"""
+        try:
+            self._run()
+        finally:
+            self.finished.set()
+    
+    def close(self):
+        """Exit the ring and close the wake-up sockets, once run() has returned"""
+        if self.ring_ready:
+            self.ring_ready = False
+            liburing.io_uring_queue_exit(self.ring)
+        for wake_sock in (self.wake_recv, self.wake_send):
+            wake_sock.close()
+    
+    def _run(self):
+        liburing.io_uring_queue_init(URING_ENTRIES, self.ring, 0)
+        self.ring_ready = True
+        self._submit_accept()
+        liburing.io_uring_submit(self.ring)
+        
+        # liburing's blocking waits hold the GIL, which would freeze the monitor and
+        # console threads; poll the ring fd instead and only peek at completions
+        poller = select.poll()
+        poller.register(self.ring.ring_fd, select.POLLIN)
+        poller.register(self.wake_recv, select.POLLIN)
+        
+        last_sweep = time.monotonic()
+        while self.server.running:
+            poller.poll(1000)
+            self._drain_posted()
+            
+            # Walk the completions with the CQ ring mask applied (wraps around the
+            # end of the ring), then release them all with one head update
+            reaped = 0
+            for _ in liburing.CqeIter(self.ring, self.cqe):
+                entry = self.cqe[0]  # The iterator only updates index 0
+                user_data = entry.user_data
+                try:
+                    res = entry.res
+                except OSError as e:
+                    res = -e.errno
+                self._complete(user_data, res)
+                reaped += 1
+            if reaped:
+                liburing.io_uring_cq_advance(self.ring, reaped)
+            
+            now = time.monotonic()
+            if now - last_sweep >= 1.0:
+                last_sweep = now
+                self._close_idle(now)
+            
+            # One submission for everything queued while handling this batch
+            liburing.io_uring_submit(self.ring)
+        
+        for state in list(self.conns.values()):
+            self._close(state)
+    
+    def post(self, state: UringClientState, frame: bytes):
+        """Queue a frame for sending from another thread"""
+        self.posted.append((state, frame))
+        self.wake()
+    
+    def wake(self):
+        """Interrupt the completion wait from another thread"""
+        try:
+            self.wake_send.send(b"\0")
+        except OSError:
+            pass
+    
+    def _get_sqe(self):
+        """Get a submission entry, flushing the queue first if it is full"""
+        sqe = liburing.io_uring_get_sqe(self.ring)
+        if sqe is None:
+            liburing.io_uring_submit(self.ring)
+            sqe = liburing.io_uring_get_sqe(self.ring)
+        return sqe
+    
+    def _submit_accept(self):
+        sqe = self._get_sqe()
+        liburing.io_uring_prep_accept(sqe, self.listen_sock.fileno())
+        sqe.user_data = _URING_ACCEPT
+    
+    def _submit_recv(self, state: UringClientState):
+        sqe = self._get_sqe()
+        liburing.io_uring_prep_recv(sqe, state.sock.fileno(), state.recv_buf)
+        sqe.user_data = state.conn_id << 2 | _URING_RECV
+        state.inflight += 1
+    
+    def _submit_send(self, state: UringClientState, frame: bytes):
+        state.sending = frame
+        sqe = self._get_sqe()
+        liburing.io_uring_prep_send(sqe, state.sock.fileno(), frame)
+        sqe.user_data = state.conn_id << 2 | _URING_SEND
+        state.inflight += 1
+    
+    def _queue_send(self, state: UringClientState, frame: bytes):
+        """Send frame now, or after the in-flight send to keep ordering"""
+        if state.closing:
+            return
+        if state.sending is None:
+            self._submit_send(state, frame)
+        else:
+            state.outbox.append(frame)
+    
+    def _complete(self, user_data: int, res: int):
+        """Dispatch one completion"""
+        op = user_data & 3
+        if op == _URING_ACCEPT:
+            self._on_accept(res)
+            return
+        
+        state = self.conns.get(user_data >> 2)
+        if state is None:
+            return
+        state.inflight -= 1
+        if op == _URING_RECV:
+            self._on_recv(state, res)
+        else:
+            self._on_send(state, res)
+        if state.closing and not state.inflight:
+            self.conns.pop(state.conn_id, None)
+    
+    def _on_accept(self, res: int):
+        if not self.server.running:
+            return
+        self._submit_accept()
+        if res < 0:
+            return
+        
+        sock = socket.socket(fileno=res)
+        try:
+            address = sock.getpeername()
+        except OSError:
+            sock.close()
+            return
+        
+        state = UringClientState(address, sock, self.next_conn_id)
+        self.next_conn_id += 1
+        self.conns[state.conn_id] = state
+        self.server._add_client(sock.fileno(), state)
+        self._submit_recv(state)
+    
+    def _drain_posted(self):
+        """Queue frames handed over by other threads"""
+        try:
+            while self.wake_recv.recv(4096):
+                pass
+        except OSError:
+            pass  # Nothing (more) to read
+        while self.posted:
+            state, frame = self.posted.popleft()
+            self._queue_send(state, frame)
+    
+    def _on_recv(self, state: UringClientState, res: int):
+        if res <= 0 or state.closing:
+            self._close(state)
+            return
+        state.last_activity = time.monotonic()
+        
+        if state.pending:
+            state.pending += state.recv_buf[:res]
+            consumed = self._consume(state, state.pending, len(state.pending))
+            del state.pending[:consumed]
+        else:
+            # Parse straight out of the receive buffer; keep only a trailing partial message
+            consumed = self._consume(state, state.recv_buf, res)
+            if consumed < res:
+                state.pending += state.recv_buf[consumed:res]
+        
+        if not state.closing:
+            self._submit_recv(state)
+    
+    def _consume(self, state: UringClientState, buf: bytearray, end: int) -> int:
+        """Handle every complete message in buf[:end], returning the bytes used"""
+        server = self.server
+        view = memoryview(buf)
+        offset = 0
+        responses = []  # Queued as one send once the batch is handled
+        while end - offset >= 4:
+            version, msg_type, length = _HEADER.unpack_from(buf, offset)
+            if end - offset < 4 + length:
+                break
+            data = view[offset + 4:offset + 4 + length] if length else b""
+            offset += 4 + length
+            
+            state.messages += 1
+            response = server._handle_message(state, msg_type, data)
+            if response is not None:
+                responses.append(response)
+        
+        if responses:
+            self._queue_send(state, responses[0] if len(responses) == 1 else b"".join(responses))
+        return offset
+    
+    def _on_send(self, state: UringClientState, res: int):
+        if res < 0:
+            self._close(state)
+            return
+        frame = state.sending
+        state.sending = None
+        if res < len(frame):
+            self._submit_send(state, frame[res:])
+        elif state.outbox and not state.closing:
+            # Everything queued behind the finished send goes out in one operation
+            frames = state.outbox
+            frame = frames.popleft() if len(frames) == 1 else b"".join(frames)
+            frames.clear()
+            self._submit_send(state, frame)
+    
+    def _close(self, state: UringClientState):
+        """Close a connection; its state is dropped once pending operations finish"""
+        if state.closing:
+            return
+        state.closing = True
+        state.outbox.clear()
+        self.server._remove_client(state.sock.fileno(), state)
+        try:
+            # Completes the outstanding recv, then release the fd
+            state.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        state.sock.close()
+        if not state.inflight:
+            self.conns.pop(state.conn_id, None)
+    
+    def _close_idle(self, now: float):
+        """Drop clients that have been silent for longer than TIMEOUT"""
+        for state in list(self.conns.values()):
+            if not state.closing and now - state.last_activity > TIMEOUT:
+                if self.server.verbose:
+                    safe_print("[RX] Receive timeout")
+                self._close(state)
+
+
 class RemBrailleServer:
     """Dummy RemBraille server for testing"""
     
-    def __init__(self, port: int = REMBRAILLE_PORT, num_cells: int = 40, verbose: bool = False):
+    def __init__(self, port: int = REMBRAILLE_PORT, num_cells: int = 40, verbose: bool = False,
+                 threaded: bool = False, io_uring: bool = False):
         self.port = port
         self.num_cells = num_cells
         self.verbose = verbose
+        self.threaded = threaded
+        self.io_uring = io_uring
         self.running = False
-        self.clients: Dict[str, Any] = {}
+        self.started = threading.Event()  # Set once the server is accepting clients
+        self.clients: Dict[int, ClientState] = {}  # Keyed by socket fileno
+        self._clients_lock = threading.Lock()
         self.server_socket: Optional[socket.socket] = None
         
-        # Current braille display content
-        self.current_braille_cells: List[int] = []
-        self.current_braille_text = ""
-        self.current_ascii_text = ""
+        # Responses are constant for the server's lifetime, so serialize them once
+        self._handshake_resp = RemBrailleMessage(MSG_HANDSHAKE_RESP, b"RemBraille_Dummy_Server_OK;delta").serialize()
+        self._num_cells_resp = RemBrailleMessage(MSG_NUM_CELLS_RESP, _CELL_COUNT.pack(num_cells)).serialize()
+        self._pong = _EMPTY_FRAMES[MSG_PONG]
+        
+        # Message type -> handler(state, payload) returning optional response bytes
+        self._dispatch = {
+            MSG_HANDSHAKE: self._on_handshake,
+            MSG_NUM_CELLS_REQ: self._on_num_cells,
+            MSG_DISPLAY_CELLS: self._on_display,
+            MSG_DISPLAY_CELLS_DELTA: self._on_display_delta,
+            MSG_PING: self._on_ping,
+            MSG_KEY_EVENT: self._on_key_event,
+        }
+        
+        # Event loop state (asyncio mode only)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        
+        # Completion loop (io_uring mode only)
+        self._uring: Optional[UringLoop] = None
+        
+        # Bounded worker pool for client connections, and a socket pair that
+        # wakes the accept loop on stop (threaded mode only)
+        self._pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._wake_recv: Optional[socket.socket] = None
+        self._wake_send: Optional[socket.socket] = None
+        
+        # Current braille display content (converted to text only when drawn)
+        self.current_braille_cells = b""
         self.display_lock = threading.Lock()
         
         # Message log for scrolling display
-        self.message_log: List[str] = []
+        # Entries are (wall-clock time or None, %-format, args); text is only
+        # formatted when the line is drawn; the deque drops the oldest entry itself
         self.max_log_lines = 10
+        self.message_log: collections.deque = collections.deque(maxlen=self.max_log_lines)
+        self._screen_cleared = False  # ANSI redraw: the first frame clears the screen
+        self._display_logged_at = 0.0  # Monotonic time of the last display update log line
         
         # Statistics
         self.stats = {
             'connections': 0,
             'messages_received': 0,
             'cells_displayed': 0,
-            'start_time': None
+            'start_time': None  # time.monotonic() when the server started
         }
     
-    def _add_message_to_log(self, message: str):
-        """Add a message to the scrolling log"""
-        with self.display_lock:
-            self.message_log.append(message)
-            if len(self.message_log) > self.max_log_lines:
-                self.message_log.pop(0)
+    def _add_message_to_log(self, message: str, *args, timestamped: bool = False):
+        """Add a message to the scrolling log, optionally stamped with the current time
+        
+        Like logging calls, args are %-formatted into message lazily on display.
+        """
+        # deque.append is atomic, so logging never waits on the display lock
+        self.message_log.append((time.time() if timestamped else None, message, args))
     
     def _update_display(self):
         """Update the static display with current stats and braille content"""
         if not self.running:
             return
-            
-        # Clear screen for fresh display
-        clear_screen()
+        
+        # Snapshot shared state so receivers never wait on terminal output
+        # (deque.copy is atomic, like append)
+        log_entries = self.message_log.copy()
+        with self.display_lock:
+            braille_cells = self.current_braille_cells
         
         # Show title
-        safe_print("+" + "=" * 72 + "+")
-        safe_print("|              RemBraille Test Server - Live Monitor                  |")
-        safe_print("+" + "=" * 72 + "+")
-        safe_print("")
+        lines = [
+            "+" + "=" * 72 + "+",
+            "|              RemBraille Test Server - Live Monitor                  |",
+            "+" + "=" * 72 + "+",
+            "",
+        ]
         
         # Show message log
-        safe_print("Recent Messages:")
-        safe_print("-" * 72)
-        for msg in self.message_log[-self.max_log_lines:]:
-            safe_print(msg[:72])  # Truncate long lines
+        lines.append("Recent Messages:")
+        lines.append("-" * 72)
+        for when, msg, args in log_entries:
+            if args:
+                msg = msg % args
+            if when is not None:
+                msg = f"[{format_timestamp(when)}] {msg}"
+            lines.append(msg[:72])  # Truncate long lines
         
         # Pad empty lines
-        for _ in range(self.max_log_lines - len(self.message_log)):
-            safe_print("")
+        lines.extend([""] * (self.max_log_lines - len(log_entries)))
         
-        safe_print("-" * 72)
-        safe_print("")
+        lines.append("-" * 72)
+        lines.append("")
         
         # Show stats box
-        uptime = datetime.now() - self.stats['start_time'] if self.stats['start_time'] else None
-        uptime_str = str(uptime).split('.')[0] if uptime else "00:00:00"
+        uptime = int(time.monotonic() - self.stats['start_time']) if self.stats['start_time'] else 0
+        uptime_str = f"{uptime // 3600:02d}:{uptime // 60 % 60:02d}:{uptime % 60:02d}"
         
-        safe_print("+" + "=" * 30 + " STATISTICS " + "=" * 30 + "+")
-        safe_print(f"| Port: {self.port:<6} | Cells: {self.num_cells:<3} | Uptime: {uptime_str:<8} | Clients: {len(self.clients):<3}    |")
-        safe_print(f"| Connections: {self.stats['connections']:<4} | Messages: {self.stats['messages_received']:<6} | Cells Displayed: {self.stats['cells_displayed']:<8} |")
-        safe_print("+" + "-" * 72 + "+")
-        safe_print("|                        CURRENT BRAILLE DISPLAY                       |")
-        safe_print("+" + "-" * 72 + "+")
+        lines.append("+" + "=" * 30 + " STATISTICS " + "=" * 30 + "+")
+        lines.append(f"| Port: {self.port:<6} | Cells: {self.num_cells:<3} | Uptime: {uptime_str:<8} | Clients: {len(self.clients):<3}    |")
+        lines.append(f"| Connections: {self.stats['connections']:<4} | Messages: {self._messages_received():<6} | Cells Displayed: {self.stats['cells_displayed']:<8} |")
+        lines.append("+" + "-" * 72 + "+")
+        lines.append("|                        CURRENT BRAILLE DISPLAY                       |")
+        lines.append("+" + "-" * 72 + "+")
         
         # Show current braille content
-        with self.display_lock:
-            if self.current_braille_text:
-                # Braille line
-                braille_line = f"| Braille: {self.current_braille_text[:60]:<60} |"
-                safe_print(braille_line)
-                # ASCII line
-                ascii_line = f"| ASCII:   {self.current_ascii_text[:60]:<60} |"
-                safe_print(ascii_line)
-                # Hex line if verbose
-                if self.verbose and self.current_braille_cells:
-                    hex_vals = ' '.join(f'{c:02X}' for c in self.current_braille_cells[:20])
-                    hex_line = f"| Hex:     {hex_vals[:60]:<60} |"
-                    safe_print(hex_line)
-            else:
-                safe_print("|                         (No content displayed)                       |")
-                if self.verbose:
-                    safe_print("|                                                                      |")
-        
-        safe_print("+" + "=" * 72 + "+")
-        safe_print("")
-        safe_print("Commands: [s]tats [k]ey test [q]uit [h]elp")
+        if braille_cells:
+            # Only the first 60 cells fit in the box
+            shown = braille_cells[:60]
+            braille_text = self._cells_to_braille(shown)
+            ascii_text = self._cells_to_ascii(shown)
+            # Braille line
+            lines.append(f"| Braille: {braille_text:<60} |")
+            # ASCII line
+            lines.append(f"| ASCII:   {ascii_text:<60} |")
+            # Hex line if verbose
+            if self.verbose and braille_cells:
+                hex_vals = braille_cells[:20].hex(' ').upper()
+                lines.append(f"| Hex:     {hex_vals[:60]:<60} |")
+        else:
+            lines.append("|                         (No content displayed)                       |")
+            if self.verbose:
+                lines.append("|                                                                      |")
+        
+        lines.append("+" + "=" * 72 + "+")
+        lines.append("")
+        lines.append("Commands: [s]tats [k]ey test [q]uit [h]elp")
+        
+        if _ANSI_REDRAW:
+            # Home the cursor and overwrite the previous frame, erasing each line's
+            # leftovers and anything below, instead of running clear every second
+            prefix = "\033[H" if self._screen_cleared else "\033[2J\033[H"
+            self._screen_cleared = True
+            safe_print(prefix + "\033[K\n".join(lines), end="\033[K\n\033[J")
+        else:
+            # Clear screen for fresh display, then draw the whole frame in one write
+            clear_screen()
+            safe_print("\n".join(lines))
     
     def start(self):
         """Start the RemBraille server"""
+        if self.threaded:
+            self._start_threaded()
+            return
+        
+        if self.io_uring:
+            if liburing is not None and sys.platform == 'linux':
+                self._start_io_uring()
+                return
+            safe_print("⚠️  io_uring needs Linux and the liburing package; using asyncio instead")
+        
         try:
-            self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            
-            # Handle potential binding issues on macOS/Unix
+            if uvloop is not None:
+                uvloop.install()
+            asyncio.run(self._serve())
+        except Exception as e:
+            print(f"[ERROR] Failed to start server: {e}")
+            sys.exit(1)
+    
+    def _exit_on_bind_error(self, e: OSError):
+        """Report well-known bind failures and exit"""
+        if e.errno == 48:  # Address already in use (macOS)
+            safe_print(f"❌ Port {self.port} is already in use. Please try a different port or kill the existing process.")
+            sys.exit(1)
+        elif e.errno == 13:  # Permission denied
+            safe_print(f"❌ Permission denied to bind to port {self.port}. Try using a port > 1024 or run with sudo.")
+            sys.exit(1)
+    
+    def _on_started(self):
+        """Mark the server as running and draw the first live monitor frame"""
+        self.running = True
+        self.stats['start_time'] = time.monotonic()
+        self.started.set()
+        
+        # Initial display
+        self._update_display()
+        
+        self._add_message_to_log(f"Server started on port {self.port}", timestamped=True)
+    
+    async def _serve(self):
+        """Accept clients on the event loop until stop() is called"""
+        self._stop_event = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        
+        try:
+            server = await asyncio.start_server(
+                self._handle_client_async, '0.0.0.0', self.port, backlog=socket.SOMAXCONN
+            )
+        except OSError as e:
+            self._exit_on_bind_error(e)
+            raise
+        
+        self._on_started()
+        
+        async with server:
+            await self._stop_event.wait()
+    
+    def _shutdown_async(self):
+        """Close all client streams and end _serve (runs on the event loop)"""
+        for state in self._client_snapshot():
             try:
-                self.server_socket.bind(('0.0.0.0', self.port))
-            except OSError as e:
-                if e.errno == 48:  # Address already in use (macOS)
-                    safe_print(f"❌ Port {self.port} is already in use. Please try a different port or kill the existing process.")
-                    sys.exit(1)
-                elif e.errno == 13:  # Permission denied
-                    safe_print(f"❌ Permission denied to bind to port {self.port}. Try using a port > 1024 or run with sudo.")
-                    sys.exit(1)
-                else:
-                    raise
-            
-            self.server_socket.listen(5)
-            
-            self.running = True
-            self.stats['start_time'] = datetime.now()
-            
-            # Initial display
-            self._update_display()
-            
-            # Start display update thread
-            display_thread = threading.Thread(target=self._display_update_loop, daemon=True)
-            display_thread.start()
-            
-            self._add_message_to_log(f"[{datetime.now().strftime('%H:%M:%S')}] Server started on port {self.port}")
+                state.writer.close()
+            except:
+                pass
+        if self._stop_event:
+            self._stop_event.set()
+    
+    def _listen(self):
+        """Create, bind and listen on self.server_socket"""
+        self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            # Accepted sockets inherit this where the platform supports it
+            self.server_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError:
+            pass
+        
+        # Handle potential binding issues on macOS/Unix
+        try:
+            self.server_socket.bind(('0.0.0.0', self.port))
+        except OSError as e:
+            self._exit_on_bind_error(e)
+            raise
+        
+        self.server_socket.listen(socket.SOMAXCONN)
+    
+    def _start_io_uring(self):
+        """Start the server on a single io_uring completion loop"""
+        try:
+            self._listen()
+            self._uring = UringLoop(self, self.server_socket)
+            self._on_started()
+            self._uring.run()
+        
+        except Exception as e:
+            print(f"[ERROR] Failed to start server: {e}")
+            sys.exit(1)
+    
+    def _start_threaded(self):
+        """Start the server with one pool thread per client"""
+        try:
+            self._listen()
+            self._pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=MAX_CLIENT_THREADS, thread_name_prefix='rb-client'
+            )
+            self._wake_recv, self._wake_send = socket.socketpair()
+            self.server_socket.setblocking(False)
+            self._on_started()
             
-            while self.running:
-                try:
-                    client_socket, address = self.server_socket.accept()
-                    client_thread = threading.Thread(
-                        target=self._handle_client,
-                        args=(client_socket, address),
-                        daemon=True
-                    )
-                    client_thread.start()
-                    
-                except OSError:
-                    if self.running:  # Only log if not shutting down
-                        safe_print("❌ Error accepting connections")
-                        break
+            with selectors.DefaultSelector() as selector:
+                selector.register(self.server_socket, selectors.EVENT_READ)
+                selector.register(self._wake_recv, selectors.EVENT_READ)
+                
+                while self.running:
+                    for key, _ in selector.select():
+                        if key.fileobj is self._wake_recv:
+                            return  # stop() was called
+                        if not self._accept_pending():
+                            return
         
         except Exception as e:
             print(f"[ERROR] Failed to start server: {e}")
             sys.exit(1)
+        
+        finally:
+            for wake_sock in (self._wake_recv, self._wake_send):
+                if wake_sock:
+                    wake_sock.close()
     
-    def _display_update_loop(self):
-        """Background thread to update the display periodically"""
-        while self.running:
-            time.sleep(1)  # Update every second
-            self._update_display()
+    def _accept_pending(self) -> bool:
+        """Hand every queued connection to the pool; False if the listener failed"""
+        while True:
+            try:
+                client_socket, address = self.server_socket.accept()
+            except BlockingIOError:
+                return True
+            except OSError:
+                if self.running:  # Only log if not shutting down
+                    safe_print("❌ Error accepting connections")
+                return False
+            self._pool.submit(self._handle_client, client_socket, address)
     
     def stop(self):
         """Stop the RemBraille server"""
         self.running = False
         
         # Close all client connections
-        for client_id, client_info in list(self.clients.items()):
+        if self._uring is not None:
+            self._uring.wake()  # The completion loop closes its clients on exit
+            if self._uring.finished.wait(TIMEOUT):
+                self._uring.close()
+        elif self._loop is not None:
             try:
-                client_info['socket'].close()
-            except:
-                pass
+                self._loop.call_soon_threadsafe(self._shutdown_async)
+            except RuntimeError:
+                pass  # Event loop already closed
+        else:
+            if self._wake_send is not None:
+                try:
+                    self._wake_send.send(b"\0")
+                except OSError:
+                    pass
+            for state in self._client_snapshot():
+                try:
+                    # Shutdown wakes the worker blocked in recv so the pool can exit
+                    state.sock.shutdown(socket.SHUT_RDWR)
+                    state.sock.close()
+                except:
+                    pass
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
         
         # Close server socket
         if self.server_socket:
@@ -321,228 +917,402 @@ class RemBrailleServer:
     
     def _handle_client(self, client_socket: socket.socket, address: tuple):
         """Handle a client connection"""
-        client_id = f"{address[0]}:{address[1]}"
+        state = ClientState(address, sock=client_socket)
+        # Receive buffer (and a view over it) reused for every message on this connection
+        state.recv_buf = bytearray(MAX_MESSAGE_SIZE)
+        state.recv_view = memoryview(state.recv_buf)
+        key = client_socket.fileno()
+        self._add_client(key, state)
         
-        self._add_message_to_log(f"[{datetime.now().strftime('%H:%M:%S')}] Client connected: {client_id}")
-        self.stats['connections'] += 1
-        
-        self.clients[client_id] = {
-            'socket': client_socket,
-            'address': address,
-            'connected_at': datetime.now(),
-            'last_activity': datetime.now()
-        }
+        # Responses to messages that arrived together, sent as one write
+        responses: List[bytes] = []
         
         try:
             client_socket.settimeout(TIMEOUT)
             
             while self.running:
                 # Receive message
-                message = self._receive_message(client_socket)
-                if not message:
+                received = self._receive_message(state)
+                if received is None:
                     break
                 
-                self.clients[client_id]['last_activity'] = datetime.now()
-                self.stats['messages_received'] += 1
+                state.last_activity = time.monotonic()
+                state.messages += 1
                 
                 # Handle message
-                self._handle_message(client_socket, client_id, message)
+                response = self._handle_message(state, *received)
+                if response is not None:
+                    responses.append(response)
+                
+                # Flush before the next receive could block on the socket
+                if responses and not self._message_buffered(state):
+                    frame = responses[0] if len(responses) == 1 else b"".join(responses)
+                    responses.clear()
+                    if not self._send_frame(state, frame):
+                        break
         
         except Exception as e:
             if self.verbose:
-                safe_print(f"⚠️  Client {client_id} error: {e}")
+                safe_print(f"[ERR] Client {state.client_id} error: {e}")
         
         finally:
-            # Clean up
+            # Clean up (unregister first so a reused fileno can't be removed)
+            self._remove_client(key, state)
             try:
                 client_socket.close()
             except:
                 pass
-            
-            if client_id in self.clients:
-                duration = (datetime.now() - self.clients[client_id]['connected_at']).total_seconds()
-                self._add_message_to_log(f"[{datetime.now().strftime('%H:%M:%S')}] Client disconnected: {client_id} ({duration:.1f}s)")
-                del self.clients[client_id]
     
-    def _receive_message(self, client_socket: socket.socket) -> Optional[RemBrailleMessage]:
-        """Receive a message from client"""
+    def _add_client(self, key: int, state: ClientState):
+        """Tune a new client's socket, then register and log it"""
+        self._configure_client_socket(state.sock or state.writer.get_extra_info('socket'))
+        self._add_message_to_log(f"Client connected: {state.client_id}", timestamped=True)
+        with self._clients_lock:
+            self.stats['connections'] += 1
+            self.clients[key] = state
+    
+    def _client_snapshot(self) -> List[ClientState]:
+        """Connected clients, safe to iterate while others connect or leave"""
+        with self._clients_lock:
+            return list(self.clients.values())
+    
+    def _messages_received(self) -> int:
+        """Messages from disconnected clients plus the live per-client counts"""
+        with self._clients_lock:
+            return self.stats['messages_received'] + sum(state.messages for state in self.clients.values())
+    
+    def _configure_client_socket(self, sock):
+        """Tune an accepted socket for small, latency-sensitive control messages"""
+        try:
+            # Answer pings and handshakes immediately instead of waiting for Nagle coalescing
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Let the kernel reap clients whose VM went away without closing
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            for option in (socket.SO_RCVBUF, socket.SO_SNDBUF):
+                if sock.getsockopt(socket.SOL_SOCKET, option) < SOCKET_BUFFER_SIZE:
+                    sock.setsockopt(socket.SOL_SOCKET, option, SOCKET_BUFFER_SIZE)
+        except OSError as e:
+            if self.verbose:
+                safe_print(f"⚠️  Could not set socket options: {e}")
+    
+    def _remove_client(self, key: int, state: ClientState):
+        """Unregister a client and log how long it was connected"""
+        with self._clients_lock:
+            if self.clients.get(key) is not state:
+                return
+            del self.clients[key]
+            # Fold the connection's message count into the total
+            self.stats['messages_received'] += state.messages
+        duration = time.monotonic() - state.connected_at
+        self._add_message_to_log(f"Client disconnected: {state.client_id} ({duration:.1f}s)", timestamped=True)
+    
+    async def _handle_client_async(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Handle a client connection on the event loop"""
+        state = ClientState(writer.get_extra_info('peername'), writer=writer)
+        key = writer.get_extra_info('socket').fileno()
+        self._add_client(key, state)
+        
+        try:
+            while self.running:
+                # Receive message
+                received = await self._receive_message_async(reader)
+                if received is None:
+                    break
+                
+                state.last_activity = time.monotonic()
+                state.messages += 1
+                
+                # Handle message
+                response = self._handle_message(state, *received)
+                if response is not None and not await self._send_frame_async(writer, response):
+                    break
+        
+        except Exception as e:
+            if self.verbose:
+                safe_print(f"[ERR] Client {state.client_id} error: {e}")
+        
+        finally:
+            # Clean up
+            self._remove_client(key, state)
+            try:
+                writer.close()
+            except:
+                pass
+    
+    async def _receive_message_async(self, reader: asyncio.StreamReader) -> Optional[Tuple[int, bytes]]:
+        """Receive a message from client stream as (msg_type, payload)"""
         try:
             # Read header
-            header_data = self._receive_exact(client_socket, 4)
-            if not header_data:
-                return None
-            
-            version, msg_type, length = struct.unpack("!BBH", header_data)
+            header_data = await asyncio.wait_for(reader.readexactly(4), TIMEOUT)
+            version, msg_type, length = _HEADER.unpack(header_data)
             
             # Read data
             data = b""
             if length > 0:
-                data = self._receive_exact(client_socket, length)
-                if not data:
-                    return None
+                data = await asyncio.wait_for(reader.readexactly(length), TIMEOUT)
             
-            return RemBrailleMessage(msg_type, data)
+            return msg_type, data
         
+        except asyncio.IncompleteReadError:
+            return None
+        except asyncio.TimeoutError:
+            if self.verbose:
+                safe_print("[RX] Receive timeout")
+            return None
         except Exception as e:
             if self.verbose:
-                safe_print(f"❌ Error receiving message: {e}")
+                safe_print(f"[RX] Error receiving message: {e}")
             return None
     
-    def _receive_exact(self, client_socket: socket.socket, length: int) -> Optional[bytes]:
-        """Receive exactly the specified number of bytes"""
-        data = b""
-        while len(data) < length:
-            try:
-                chunk = client_socket.recv(length - len(data))
-                if not chunk:
+    def _receive_message(self, state: ClientState) -> Optional[Tuple[int, Payload]]:
+        """Receive the next message for a threaded client as (msg_type, payload)
+        
+        Each recv_into takes everything the socket has buffered, so back-to-back
+        messages are parsed from state.recv_buf without further syscalls.
+        """
+        buf, view = state.recv_buf, state.recv_view
+        try:
+            while True:
+                start, end = state.recv_start, state.recv_end
+                if end - start >= 4:
+                    version, msg_type, length = _HEADER.unpack_from(buf, start)
+                    if end - start >= 4 + length:
+                        state.recv_start = start + 4 + length
+                        # Valid until the next receive
+                        return msg_type, view[start + 4:state.recv_start] if length else b""
+                
+                if start:
+                    # Move the partial message to the front so a whole one always fits
+                    view[:end - start] = view[start:end]
+                    state.recv_start, state.recv_end = 0, end - start
+                
+                received = state.sock.recv_into(view[state.recv_end:])
+                if not received:
                     return None
-                data += chunk
-            except socket.timeout:
-                if self.verbose:
-                    safe_print("⏱️  Receive timeout")
-                return None
-            except Exception:
-                return None
-        return data
-    
-    def _handle_message(self, client_socket: socket.socket, client_id: str, message: RemBrailleMessage):
-        """Handle received message"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        msg_name = MSG_NAMES.get(message.msg_type, f"UNKNOWN({message.msg_type})")
-        
-        self._add_message_to_log(f"[{timestamp}] {client_id} -> {msg_name}")
-        
-        if message.msg_type == MSG_HANDSHAKE:
-            client_info = message.data.decode('utf-8', errors='ignore')
-            self._add_message_to_log(f"  Handshake: {client_info}")
-            
-            # Send handshake response
-            response = RemBrailleMessage(MSG_HANDSHAKE_RESP, b"RemBraille_Dummy_Server_OK")
-            self._send_message(client_socket, response)
-        
-        elif message.msg_type == MSG_NUM_CELLS_REQ:
-            # Send number of cells
-            cells_data = struct.pack("!H", self.num_cells)
-            response = RemBrailleMessage(MSG_NUM_CELLS_RESP, cells_data)
-            self._send_message(client_socket, response)
-            self._add_message_to_log(f"  Sent cell count: {self.num_cells}")
-        
-        elif message.msg_type == MSG_DISPLAY_CELLS:
-            cells = list(message.data)
-            self.stats['cells_displayed'] += len(cells)
-            
-            # Update current display content
-            with self.display_lock:
-                self.current_braille_cells = cells
-                self.current_braille_text = self._cells_to_braille(cells)
-                self.current_ascii_text = self._cells_to_ascii(cells)
-            
-            self._add_message_to_log(f"  Display: {len(cells)} cells")
+                state.recv_end += received
         
-        elif message.msg_type == MSG_PING:
-            # Send pong response
-            pong = RemBrailleMessage(MSG_PONG)
-            self._send_message(client_socket, pong)
+        except socket.timeout:
+            if self.verbose:
+                safe_print("[RX] Receive timeout")
+            return None
+        except OSError:
+            return None
+        except Exception as e:
             if self.verbose:
-                self._add_message_to_log(f"  Ping/Pong")
+                safe_print(f"[RX] Error receiving message: {e}")
+            return None
+    
+    def _message_buffered(self, state: ClientState) -> bool:
+        """Whether a complete message is waiting in a threaded client's receive buffer"""
+        available = state.recv_end - state.recv_start
+        return available >= 4 and available >= 4 + _HEADER.unpack_from(state.recv_buf, state.recv_start)[2]
+    
+    def _handle_message(self, state: ClientState, msg_type: int, data: Payload) -> Optional[bytes]:
+        """Handle received message, returning the serialized response to send (if any)"""
+        msg_name = MSG_NAMES.get(msg_type, f"UNKNOWN({msg_type})")
         
-        elif message.msg_type == MSG_KEY_EVENT:
-            if len(message.data) >= 3:
-                key_id, event_type = struct.unpack("!HB", message.data[:3])
-                event_name = "PRESS" if event_type == KEY_DOWN else "RELEASE"
-                self._add_message_to_log(f"  Key: {key_id} {event_name}")
+        # Display updates stream at refresh rate; their handlers log a rate-limited summary
+        if self.verbose or msg_type not in (MSG_DISPLAY_CELLS, MSG_DISPLAY_CELLS_DELTA):
+            self._add_message_to_log("%s -> %s", state.client_id, msg_name, timestamped=True)
         
-        else:
-            self._add_message_to_log(f"  Unknown message type: {message.msg_type}")
+        handler = self._dispatch.get(msg_type)
+        if handler is None:
+            self._add_message_to_log("  Unknown message type: %d", msg_type)
+            return None
+        return handler(state, data)
+    
+    def _on_handshake(self, state: ClientState, data: Payload) -> Optional[bytes]:
+        """Log the client's handshake and accept it"""
+        client_info = str(data, 'utf-8', errors='ignore')
+        self._add_message_to_log("  Handshake: %s", client_info)
+        
+        return self._handshake_resp
+    
+    def _on_num_cells(self, state: ClientState, data: Payload) -> Optional[bytes]:
+        """Answer a cell count request"""
+        self._add_message_to_log("  Sent cell count: %d", self.num_cells)
+        return self._num_cells_resp
+    
+    def _on_display(self, state: ClientState, data: Payload) -> Optional[bytes]:
+        """Replace the current display content with a full frame"""
+        cells = bytes(data)  # Kept after the receive buffer is reused
+        
+        # Update current display content
+        with self.display_lock:
+            self.stats['cells_displayed'] += len(cells)
+            self.current_braille_cells = cells
+        
+        if self._should_log_display():
+            self._add_message_to_log("  Display: %d cells", len(cells))
+        return None
+    
+    def _on_display_delta(self, state: ClientState, data: Payload) -> Optional[bytes]:
+        """Apply changed cells to the current display content"""
+        if len(data) < 2:
+            return None
+        
+        count = _CELL_COUNT.unpack_from(data, 0)[0]
+        count = min(count, (len(data) - 2) // 3)
+        
+        with self.display_lock:
+            cells = bytearray(self.current_braille_cells)
+            for offset in range(2, 2 + 3 * count, 3):
+                index, value = _CELL_CHANGE.unpack_from(data, offset)
+                if index < len(cells):
+                    cells[index] = value
+            self.current_braille_cells = bytes(cells)
+            self.stats['cells_displayed'] += count
+        
+        if self._should_log_display():
+            self._add_message_to_log("  Display delta: %d cells changed", count)
+        return None
+    
+    def _should_log_display(self) -> bool:
+        """Whether to log a display update: always when verbose, else once per DISPLAY_LOG_INTERVAL"""
+        if self.verbose:
+            return True
+        now = time.monotonic()
+        if now - self._display_logged_at < DISPLAY_LOG_INTERVAL:
+            return False
+        self._display_logged_at = now
+        return True
+    
+    def _on_ping(self, state: ClientState, data: Payload) -> Optional[bytes]:
+        """Answer a keep-alive ping"""
+        if self.verbose:
+            self._add_message_to_log("  Ping/Pong")
+        return self._pong
+    
+    def _on_key_event(self, state: ClientState, data: Payload) -> Optional[bytes]:
+        """Log a key event echoed by the client"""
+        if len(data) >= 3:
+            key_id, event_type = _KEY_EVENT.unpack_from(data, 0)
+            event_name = "PRESS" if event_type == KEY_DOWN else "RELEASE"
+            self._add_message_to_log("  Key: %d %s", key_id, event_name)
+        return None
+    
+    def _send_frame(self, state: ClientState, frame: bytes) -> bool:
+        """Send an already serialized message to client"""
+        try:
+            with state.send_lock:
+                state.sock.sendall(frame)
+            return True
+        except Exception as e:
+            if self.verbose:
+                safe_print(f"[TX] Error sending message: {e}")
+            return False
+    
+    def _send_frame_nowait(self, state: ClientState, frame: bytes) -> bool:
+        """
+        Send a small frame without waiting on a client whose send buffer is full
+        
+        The socket keeps its timeout, so send() itself would wait for room; check
+        writability with a zero-timeout select first and skip the client otherwise.
+        """
+        sock = state.sock
+        if not state.send_lock.acquire(timeout=_BROADCAST_LOCK_TIMEOUT):
+            return False  # A reply to this client is stuck in sendall
+        try:
+            _, writable, _ = select.select([], [sock], [], 0)
+            if not writable:
+                return False  # The client is not reading; drop the frame
+            sent = sock.send(frame, _SEND_FLAGS)
+            if sent < len(frame):
+                # Half a frame is already on the stream and finishing it could block:
+                # drop the connection rather than the rest of the frame
+                sock.shutdown(socket.SHUT_RDWR)
+                return False
+            return True
+        except Exception as e:
+            if self.verbose:
+                safe_print(f"[TX] Error sending message: {e}")
+            return False
+        finally:
+            state.send_lock.release()
     
-    def _send_message(self, client_socket: socket.socket, message: RemBrailleMessage) -> bool:
-        """Send message to client"""
+    async def _send_frame_async(self, writer: asyncio.StreamWriter, frame: bytes) -> bool:
+        """Send an already serialized message to client stream"""
         try:
-            data = message.serialize()
-            client_socket.sendall(data)
+            writer.write(frame)
+            await writer.drain()
             return True
         except Exception as e:
             if self.verbose:
-                safe_print(f"❌ Error sending message: {e}")
+                safe_print(f"[TX] Error sending message: {e}")
             return False
     
-    def _cells_to_braille(self, cells: list) -> str:
+    def _cells_to_braille(self, cells: bytes) -> str:
         """Convert braille cell values to Unicode braille characters"""
-        braille_text = ""
-        for cell in cells:
-            try:
-                if cell == 0:
-                    braille_text += " "  # Blank braille cell (ASCII space)
-                else:
-                    # Convert to Unicode braille (U+2800 + cell value)
-                    braille_char = chr(0x2800 + cell)
-                    braille_text += braille_char
-            except (ValueError, OverflowError):
-                # Fallback for invalid cell values
-                braille_text += "?"
-        return braille_text
-    
-    def _cells_to_ascii(self, cells: list) -> str:
+        # U+2800 + cell is the UTF-16-BE pair (0x28, cell), so interleaving the
+        # cells with 0x28 and decoding converts the whole line at C speed
+        encoded = bytearray(2 * len(cells))
+        encoded[0::2] = b"\x28" * len(cells)
+        encoded[1::2] = cells
+        return encoded.decode('utf-16-be').replace("\u2800", " ")
+    
+    def _cells_to_ascii(self, cells: bytes) -> str:
         """Convert braille cells to approximated ASCII representation"""
-        ascii_text = ""
-        for cell in cells:
-            if cell == 0:
-                ascii_text += " "
-            else:
-                # Simple mapping for common characters
-                # This is a very basic approximation
-                if cell in range(32, 127):  # Printable ASCII range
-                    try:
-                        ascii_text += chr(cell)
-                    except:
-                        ascii_text += "?"
-                else:
-                    ascii_text += "?"
-        return ascii_text
+        # Printable ASCII values map to themselves, anything else to '?', so the
+        # result takes the ASCII-only decode fast path
+        return cells.translate(_ASCII_TABLE).decode('ascii')
     
     def send_test_key_event(self, key_id: int = 100, is_press: bool = True):
         """Send a test key event to all connected clients"""
-        if not self.clients:
+        clients = self._client_snapshot()
+        if not clients:
             self._add_message_to_log("No connected clients to send key event")
             return
         
         event_type = KEY_DOWN if is_press else KEY_UP
         event_name = "PRESS" if is_press else "RELEASE"
-        key_data = struct.pack("!HB", key_id, event_type)
-        message = RemBrailleMessage(MSG_KEY_EVENT, key_data)
+        # Serialize once; every client gets the same frame
+        frame = RemBrailleMessage(MSG_KEY_EVENT, _KEY_EVENT.pack(key_id, event_type)).serialize()
         
         self._add_message_to_log(f"Sending test key: {key_id} {event_name}")
         
         sent_count = 0
-        for client_id, client_info in self.clients.items():
-            if self._send_message(client_info['socket'], message):
+        for state in clients:
+            if state.writer is not None:
+                # Streams belong to the event loop thread
+                try:
+                    self._loop.call_soon_threadsafe(state.writer.write, frame)
+                    sent_count += 1
+                except RuntimeError:
+                    pass
+            elif isinstance(state, UringClientState):
+                # Sockets belong to the completion loop
+                self._uring.post(state, frame)
+                sent_count += 1
+            elif self._send_frame_nowait(state, frame):
                 sent_count += 1
         
-        self._add_message_to_log(f"  Sent to {sent_count}/{len(self.clients)} clients")
+        self._add_message_to_log("  Sent to %d/%d clients", sent_count, len(clients))
+
+
+def read_commands(commands: queue.Queue):
+    """Put each line typed on stdin into commands, then None at end of input"""
+    try:
+        while True:
+            commands.put(input())
+    except (EOFError, OSError, ValueError):
+        pass
+    commands.put(None)
 
 
 def main():
     """Main entry point"""
-    # Set up signal handlers for graceful shutdown
-    server_instance = None
+    # Set up signal handlers for graceful shutdown. They only record the signal
+    # (no locks, no I/O); the command loop notices it and shuts the server down.
+    received_signals: List[int] = []
     
     def signal_handler(signum, frame):
-        safe_print(f"\n🛑 Received signal {signum}, shutting down...")
-        if server_instance:
-            server_instance.stop()
-        sys.exit(0)
+        received_signals.append(signum)
     
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
     
     # Handle Unicode output issues on some terminals
-    try:
-        # Test if we can output Unicode characters
-        test_chars = "🚀📡⚠️"
-        sys.stdout.write("")  # Test encoding
-        unicode_support = True
-    except (UnicodeEncodeError, UnicodeDecodeError):
-        unicode_support = False
+    if not _STDOUT_UNICODE:
         safe_print("Warning: Your terminal may not display Unicode characters properly.")
         safe_print("Consider setting LANG=en_US.UTF-8 or similar in your environment.")
         safe_print("")
@@ -555,6 +1325,8 @@ Examples:
   python3 rembraille_server.py                   # Start with defaults  
   python3 rembraille_server.py --port 12345      # Custom port
   python3 rembraille_server.py --cells 80 -v     # 80 cells, verbose mode
+  python3 rembraille_server.py --threaded        # Thread pool per client instead of asyncio
+  python3 rembraille_server.py --io-uring        # io_uring completion loop (Linux + liburing)
   
 Interactive commands while running:
   's' + Enter: Show statistics
@@ -583,28 +1355,59 @@ Interactive commands while running:
         help='Enable verbose output'
     )
     
+    backend = parser.add_mutually_exclusive_group()
+    backend.add_argument(
+        '--threaded',
+        action='store_true',
+        help=f'Serve each client on one of {MAX_CLIENT_THREADS} worker threads instead of the asyncio event loop'
+    )
+    backend.add_argument(
+        '--io-uring',
+        action='store_true',
+        help='Serve all clients from one io_uring completion loop (Linux, needs liburing)'
+    )
+    
     args = parser.parse_args()
     
     # Create and start server
-    server = RemBrailleServer(args.port, args.cells, args.verbose)
-    server_instance = server  # For signal handler
+    server = RemBrailleServer(args.port, args.cells, args.verbose, args.threaded, args.io_uring)
     
     try:
-        # Start server in background thread
+        # Start server in background thread (runs the event loop in asyncio mode)
         server_thread = threading.Thread(target=server.start, daemon=True)
         server_thread.start()
         
-        # Wait a moment for the server to start
-        time.sleep(0.5)
+        # Wait for the server to start (its thread ends early if it cannot)
+        while server_thread.is_alive() and not server.started.wait(0.1):
+            if received_signals:
+                return 0
         
         if not server.running:
             safe_print("❌ Failed to start server")
             return 1
         
-        # Interactive command loop (input handled silently in the background)
-        while server.running:
+        # Interactive command loop (input is read on a background thread, so a
+        # stopped server ends the loop without waiting for a keystroke). Between
+        # commands the loop also redraws the live monitor.
+        commands: queue.Queue = queue.Queue()
+        threading.Thread(target=read_commands, args=(commands,), daemon=True).start()
+        next_redraw = time.monotonic() + DISPLAY_REFRESH_INTERVAL
+        
+        while server.running and not received_signals:
             try:
-                command = input().strip().lower()
+                wait = next_redraw - time.monotonic()
+                if wait <= 0:
+                    server._update_display()
+                    next_redraw = time.monotonic() + DISPLAY_REFRESH_INTERVAL
+                    continue
+                try:
+                    line = commands.get(timeout=min(wait, 0.5))
+                except queue.Empty:
+                    continue
+                if line is None:
+                    safe_print("\n")
+                    break
+                command = line.strip().lower()
                 
                 if command == 'q':
                     break
@@ -620,9 +1423,12 @@ Interactive commands while running:
                 else:
                     server._add_message_to_log(f"Unknown command: '{command}'.")
                     
-            except (EOFError, KeyboardInterrupt):
+            except KeyboardInterrupt:
                 safe_print("\n")
                 break
+        
+        if received_signals:
+            safe_print(f"\n🛑 Received signal {received_signals[0]}, shutting down...")
     
     except Exception as e:
         safe_print(f"❌ Unexpected error: {e}")
@@ -0,0 +1,163 @@
+"""
+Round-trip tests for the add-on's RemBraille client against the dummy server
+
+Run with: python -m unittest discover tests
+"""
+
+import logging
+import os
+import struct
+import sys
+import threading
+import time
+import types
+import unittest
+from unittest import mock
+
+# NVDA provides logHandler; outside NVDA the client logs to the standard logging module
+if "logHandler" not in sys.modules:
+	_logHandler = types.ModuleType("logHandler")
+	_logHandler.log = logging.getLogger("logHandler")  # type: ignore[attr-defined]
+	sys.modules["logHandler"] = _logHandler
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "addon"))
+
+import rembraille_server  # noqa: E402
+from brailleDisplayDrivers import _remBrailleCom  # noqa: E402
+from brailleDisplayDrivers._remBrailleCom import (  # noqa: E402
+	KEY_DOWN,
+	KEY_UP,
+	MSG_DISPLAY_CELLS,
+	MSG_DISPLAY_CELLS_DELTA,
+	MSG_KEY_EVENT,
+	RemBrailleCom,
+)
+
+from test_rembraille_server import _ShortSendSocket, _free_port, _frame  # noqa: E402
+
+
+def _wait_for(condition, timeout: float = 5.0) -> bool:
+	deadline = time.monotonic() + timeout
+	while not condition():
+		if time.monotonic() > deadline:
+			return False
+		time.sleep(0.01)
+	return True
+
+
+class DeltaRoundTripTest(unittest.TestCase):
+	def setUp(self):
+		patcher = mock.patch.multiple(rembraille_server, safe_print=mock.DEFAULT, clear_screen=mock.DEFAULT)
+		patcher.start()
+		self.addCleanup(patcher.stop)
+
+		port = _free_port()
+		self.server = rembraille_server.RemBrailleServer(port, num_cells=40, threaded=True)
+		self.thread = threading.Thread(target=self.server.start, daemon=True)
+		self.thread.start()
+		self.assertTrue(self.server.started.wait(5))
+		self.addCleanup(self._stop_server)
+
+		self.keys = []
+		self.com = RemBrailleCom(on_key_event=lambda key_id, pressed: self.keys.append((key_id, pressed)),
+			auto_reconnect=False)
+		self.assertTrue(self.com.connect("127.0.0.1", port))
+		self.addCleanup(self.com.disconnect)
+
+	def _stop_server(self):
+		self.server.stop()
+		self.thread.join(5)
+
+	def _display(self, cells: bytes) -> int:
+		"""Display cells, wait for the server to show them and return the message type sent"""
+		with mock.patch.object(self.com, "_send_raw", wraps=self.com._send_raw) as send_raw:
+			self.assertTrue(self.com.display_cells(cells))
+		self.assertTrue(_wait_for(lambda: self.server.current_braille_cells == cells),
+			self.server.current_braille_cells)
+		return send_raw.call_args[0][0]
+
+	def test_changed_cells_are_sent_as_delta(self):
+		self.assertTrue(self.com._delta_supported)
+		frame = bytearray(range(40))
+		self.assertEqual(self._display(bytes(frame)), MSG_DISPLAY_CELLS)
+
+		frame[0] = 0xFF
+		frame[39] = 0x80
+		self.assertEqual(self._display(bytes(frame)), MSG_DISPLAY_CELLS_DELTA)
+
+		# Unchanged frame: an empty delta
+		self.assertEqual(self._display(bytes(frame)), MSG_DISPLAY_CELLS_DELTA)
+
+		# Most cells changed: a full frame is smaller
+		self.assertEqual(self._display(bytes(40)), MSG_DISPLAY_CELLS)
+
+	def test_encode_delta(self):
+		self.com._last_cells = bytearray(40)
+		changed = bytearray(40)
+		changed[3] = 0x07
+		changed[20] = 0x09
+		self.assertEqual(
+			self.com._encode_delta(bytes(changed)),
+			struct.pack("!H", 2) + struct.pack("!HB", 3, 0x07) + struct.pack("!HB", 20, 0x09),
+		)
+		self.assertIsNone(self.com._encode_delta(bytes(range(1, 41))))
+
+	def test_key_events_reach_the_client(self):
+		self.server.send_test_key_event(100, True)
+		self.server.send_test_key_event(100, False)
+		self.assertTrue(_wait_for(lambda: len(self.keys) == 2))
+		self.assertEqual(self.keys, [(100, True), (100, False)])
+
+
+class ParseReceivedTest(unittest.TestCase):
+	def setUp(self):
+		self.keys = []
+		self.com = RemBrailleCom(on_key_event=lambda key_id, pressed: self.keys.append((key_id, pressed)),
+			auto_reconnect=False)
+
+	def _receive(self, data: bytes):
+		"""Append data to the receive buffer as the receive loop does, then parse it"""
+		self.com._rx_buf[self.com._rx_len:self.com._rx_len + len(data)] = data
+		self.com._rx_len += len(data)
+		self.com._parse_received()
+
+	def test_several_messages_and_a_partial_tail(self):
+		down = _frame(MSG_KEY_EVENT, struct.pack("!HB", 1, KEY_DOWN))
+		up = _frame(MSG_KEY_EVENT, struct.pack("!HB", 1, KEY_UP))
+		other = _frame(MSG_KEY_EVENT, struct.pack("!HB", 513, KEY_DOWN))
+
+		self._receive(down + up + other[:5])
+		self.assertEqual(self.keys, [(1, True), (1, False)])
+		# The partial message is kept at the front of the buffer
+		self.assertEqual(self.com._rx_len, 5)
+		self.assertEqual(bytes(self.com._rx_buf[:5]), other[:5])
+
+		self._receive(other[5:] + down[:2])
+		self.assertEqual(self.keys, [(1, True), (1, False), (513, True)])
+		self.assertEqual(bytes(self.com._rx_buf[:self.com._rx_len]), down[:2])
+
+		self._receive(down[2:])
+		self.assertEqual(self.keys[-1], (1, True))
+		self.assertEqual(self.com._rx_len, 0)
+
+	def test_unsupported_version(self):
+		with self.assertRaises(ValueError):
+			self._receive(struct.pack("!BBH", 2, MSG_KEY_EVENT, 0))
+
+
+@unittest.skipUnless(_remBrailleCom._HAS_SENDMSG, "sendmsg is not available")
+class SendRawTest(unittest.TestCase):
+	def test_partial_sendmsg_completes_the_frame(self):
+		com = RemBrailleCom(auto_reconnect=False)
+		cells = bytes(range(40))
+		expected = _frame(MSG_DISPLAY_CELLS, cells)
+		# Short inside the header, at its end, and inside the payload
+		for accept in (2, 4, 6):
+			with self.subTest(accept=accept):
+				com.socket = _ShortSendSocket(accept)  # type: ignore[assignment]
+				self.assertTrue(com._send_raw(MSG_DISPLAY_CELLS, cells))
+				self.assertEqual(bytes(com.socket.sent), expected)  # type: ignore[attr-defined]
+		com.socket = None
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,223 @@
+"""
+Round-trip tests for the dummy RemBraille server
+
+Run with: python -m unittest discover tests
+The io_uring backend is skipped unless running on Linux with the liburing package installed.
+"""
+
+import socket
+import struct
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+
+import rembraille_server
+from rembraille_server import (
+    MSG_DISPLAY_CELLS,
+    MSG_DISPLAY_CELLS_DELTA,
+    MSG_HANDSHAKE,
+    MSG_HANDSHAKE_RESP,
+    MSG_NUM_CELLS_REQ,
+    MSG_NUM_CELLS_RESP,
+    MSG_PING,
+    MSG_PONG,
+    URING_ENTRIES,
+    RemBrailleMessage,
+    RemBrailleServer,
+)
+
+_HEADER = struct.Struct("!BBH")
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _recv_exact(sock: socket.socket, length: int) -> bytes:
+    data = b""
+    while len(data) < length:
+        chunk = sock.recv(length - len(data))
+        if not chunk:
+            raise ConnectionError("connection closed by server")
+        data += chunk
+    return data
+
+
+def _recv_message(sock: socket.socket):
+    """Receive one message as (type, payload)"""
+    _version, msg_type, length = _HEADER.unpack(_recv_exact(sock, 4))
+    return msg_type, _recv_exact(sock, length)
+
+
+def _frame(msg_type: int, data: bytes = b"") -> bytes:
+    return _HEADER.pack(1, msg_type, len(data)) + data
+
+
+class _ServerTests:
+    """Tests run against every server backend; subclasses set SERVER_OPTIONS"""
+
+    SERVER_OPTIONS: dict = {}
+
+    def setUp(self):
+        patcher = mock.patch.multiple(rembraille_server, safe_print=mock.DEFAULT, clear_screen=mock.DEFAULT)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        port = _free_port()
+        self.server = RemBrailleServer(port, num_cells=40, **self.SERVER_OPTIONS)
+        self.thread = threading.Thread(target=self.server.start, daemon=True)
+        self.thread.start()
+        self.assertTrue(self.server.started.wait(5))
+        self.addCleanup(self._stop_server)
+
+        self.sock = socket.create_connection(("127.0.0.1", port), timeout=5)
+        self.addCleanup(self.sock.close)
+
+    def _stop_server(self):
+        self.server.stop()
+        self.thread.join(5)
+
+    def _send(self, msg_type: int, data: bytes = b""):
+        self.sock.sendall(_frame(msg_type, data))
+
+    def _recv(self):
+        return _recv_message(self.sock)
+
+    def _sync(self):
+        """Wait until the server has handled everything sent so far"""
+        self._send(MSG_PING)
+        self.assertEqual(self._recv(), (MSG_PONG, b""))
+
+    def test_session(self):
+        self._send(MSG_HANDSHAKE, b"test")
+        msg_type, data = self._recv()
+        self.assertEqual(msg_type, MSG_HANDSHAKE_RESP)
+        self.assertIn(b"delta", data.split(b";"))
+
+        self._send(MSG_NUM_CELLS_REQ)
+        self.assertEqual(self._recv(), (MSG_NUM_CELLS_RESP, struct.pack("!H", 40)))
+
+        self._send(MSG_DISPLAY_CELLS, bytes([1, 2, 3]) + bytes(37))
+        self._sync()
+        self.assertEqual(self.server.current_braille_cells[:3], bytes([1, 2, 3]))
+
+    def test_pipelined_messages(self):
+        # Several messages arrive in one segment and are parsed out of one receive buffer
+        cells = bytes(range(40))
+        self.sock.sendall(
+            _frame(MSG_HANDSHAKE, b"test")
+            + _frame(MSG_NUM_CELLS_REQ)
+            + _frame(MSG_DISPLAY_CELLS, cells)
+            + _frame(MSG_PING)
+        )
+        self.assertEqual(self._recv()[0], MSG_HANDSHAKE_RESP)
+        self.assertEqual(self._recv(), (MSG_NUM_CELLS_RESP, struct.pack("!H", 40)))
+        self.assertEqual(self._recv(), (MSG_PONG, b""))
+        self.assertEqual(self.server.current_braille_cells, cells)
+
+    def test_message_split_across_sends(self):
+        cells = bytes(range(1, 41))
+        frame = _frame(MSG_DISPLAY_CELLS, cells)
+        # Split inside the header, then inside the payload with the next header appended
+        self.sock.sendall(frame[:2])
+        time.sleep(0.05)
+        self.sock.sendall(frame[2:10])
+        time.sleep(0.05)
+        self.sock.sendall(frame[10:] + _frame(MSG_PING)[:3])
+        time.sleep(0.05)
+        self.sock.sendall(_frame(MSG_PING)[3:])
+        self.assertEqual(self._recv(), (MSG_PONG, b""))
+        self.assertEqual(self.server.current_braille_cells, cells)
+
+    def test_display_delta(self):
+        self._send(MSG_DISPLAY_CELLS, bytes(40))
+        # [count:2] followed by [index:2][value:1] entries; out of range indexes are ignored
+        delta = struct.pack("!H", 3) + struct.pack("!HB", 0, 0xFF) + struct.pack("!HB", 39, 0x12) \
+            + struct.pack("!HB", 40, 0x34)
+        self._send(MSG_DISPLAY_CELLS_DELTA, delta)
+        self._sync()
+        self.assertEqual(self.server.current_braille_cells, b"\xff" + bytes(38) + b"\x12")
+
+        # A change count larger than the entries sent only applies the entries present
+        self._send(MSG_DISPLAY_CELLS_DELTA, struct.pack("!H", 5) + struct.pack("!HB", 1, 0x01))
+        self._sync()
+        self.assertEqual(self.server.current_braille_cells, b"\xff\x01" + bytes(37) + b"\x12")
+
+
+class AsyncioServerTest(_ServerTests, unittest.TestCase):
+    SERVER_OPTIONS = {}
+
+
+class ThreadedServerTest(_ServerTests, unittest.TestCase):
+    SERVER_OPTIONS = {"threaded": True}
+
+
+@unittest.skipUnless(
+    rembraille_server.liburing is not None and sys.platform == "linux",
+    "io_uring backend needs Linux and liburing",
+)
+class UringServerTest(_ServerTests, unittest.TestCase):
+    SERVER_OPTIONS = {"io_uring": True}
+
+    def test_uses_ring(self):
+        self.assertIsNotNone(self.server._uring)
+
+    def test_completions_wrap_the_ring(self):
+        # Many more round trips than the completion ring has entries, so its head wraps
+        for _ in range(4 * URING_ENTRIES):
+            self._send(MSG_PING)
+            self.assertEqual(self._recv(), (MSG_PONG, b""))
+
+        # Pipelined requests complete in batches
+        self.sock.sendall(_frame(MSG_PING) * URING_ENTRIES)
+        for _ in range(URING_ENTRIES):
+            self.assertEqual(self._recv(), (MSG_PONG, b""))
+
+    def test_concurrent_clients(self):
+        # Several completions per loop iteration, so batches straddle the end of the ring
+        clients = [self.sock]
+        for _ in range(31):
+            client = socket.create_connection(("127.0.0.1", self.server.port), timeout=5)
+            self.addCleanup(client.close)
+            clients.append(client)
+        for round_ in range(URING_ENTRIES // 4):
+            for client in clients:
+                client.sendall(_frame(MSG_PING))
+            for client in clients:
+                self.assertEqual(_recv_message(client), (MSG_PONG, b""), f"round {round_}")
+
+
+class _ShortSendSocket:
+    """Socket stand-in whose sendmsg accepts only the first `accept` bytes"""
+
+    def __init__(self, accept: int):
+        self.accept = accept
+        self.sent = bytearray()
+
+    def sendmsg(self, buffers):
+        data = b"".join(bytes(buf) for buf in buffers)[:self.accept]
+        self.sent += data
+        return len(data)
+
+    def sendall(self, data):
+        self.sent += data
+
+
+@unittest.skipUnless(rembraille_server._HAS_SENDMSG, "sendmsg is not available")
+class SendIntoTest(unittest.TestCase):
+    def test_partial_sendmsg_completes_the_frame(self):
+        message = RemBrailleMessage(MSG_DISPLAY_CELLS, bytes(range(40)))
+        # Short inside the header, at its end, and inside the payload
+        for accept in (2, 4, 6):
+            with self.subTest(accept=accept):
+                sock = _ShortSendSocket(accept)
+                message.send_into(sock)
+                self.assertEqual(bytes(sock.sent), message.serialize())
+
+
+if __name__ == "__main__":
+    unittest.main()